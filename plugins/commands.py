@@ -97,3 +97,23 @@ def stop():
         await watch_for_errors(data["socket"], data["token"])
 
     asyncio.run(watch())
+
+
+@beet.command("check-schemas")
+def check_schemas():
+    """Check that the manual mcdoc schema builder agrees with pydantic validation."""
+    import httpx
+    from plugins.component_caching import MCDOC_URL, check_build_schema
+
+    mcdoc = httpx.get(MCDOC_URL, follow_redirects=True).raise_for_status().json()
+    symbols = dict(mcdoc["mcdoc"])
+    for registry, entries in mcdoc["mcdoc/dispatcher"].items():
+        symbols.update({f"{registry}[{key}]": entry for key, entry in entries.items()})
+
+    mismatches = check_build_schema(symbols)
+    for path in mismatches:
+        click.echo(f"build_schema disagrees with model_validate for {path}")
+
+    click.echo(f"Checked {len(symbols)} schemas, {len(mismatches)} mismatches")
+    if mismatches:
+        raise SystemExit(1)
@@ -286,9 +286,266 @@ class Schema(RootModel):
 Schema.model_rebuild()
 
 
+def build_schema(data: Any) -> Schema:
+    """
+    Builds a `Schema` from raw mcdoc json with `model_construct`, skipping pydantic's
+    validation of the (trusted) document. Mirrors `Schema.model_validate`, including
+    attribute values and the version pruning, and raises where validation would have
+    failed. `beet check-schemas` compares the two across the whole mcdoc.
+    """
+
+    root = None if data is None else _build_root(data)
+    if root is not None and not is_valid_with_attributes(root.attributes):
+        root = None
+
+    return Schema.model_construct(root)
+
+
+def _build_root(data: dict[str, Any]) -> Any:
+    attributes = _build_attributes(data.get("attributes"))
+
+    match data["kind"]:
+        case "reference":
+            return ReferenceSchema.model_construct(
+                kind="reference", path=_expect_str(data["path"]), attributes=attributes
+            )
+        case "union":
+            return UnionSchema.model_construct(
+                kind="union",
+                members=[build_schema(member) for member in data["members"]],
+                attributes=attributes,
+            )
+        case "list":
+            return ListSchema.model_construct(
+                kind="list",
+                item=build_schema(data["item"]),
+                length_range=_build_range(data.get("lengthRange")),
+                attributes=attributes,
+            )
+        case "int_array":
+            return IntArraySchema.model_construct(
+                kind="int_array",
+                length_range=_build_range(data.get("valueRange")),
+                attributes=attributes,
+            )
+        case "float_array" | "double_array" as kind:
+            return FloatArraySchema.model_construct(
+                kind=kind,
+                length_range=_build_range(data.get("valueRange")),
+                attributes=attributes,
+            )
+        case "string":
+            return StringSchema.model_construct(kind="string", attributes=attributes)
+        case "int":
+            return IntSchema.model_construct(
+                kind="int",
+                value_range=_build_range(data.get("valueRange")),
+                attributes=attributes,
+            )
+        case "float" | "double" as kind:
+            return FloatSchema.model_construct(
+                kind=kind,
+                value_range=_build_range(data.get("valueRange")),
+                attributes=attributes,
+            )
+        case "boolean":
+            return BooleanSchema.model_construct(kind="boolean", attributes=attributes)
+        case "byte":
+            return ByteSchema.model_construct(kind="byte", attributes=attributes)
+        case "struct":
+            fields = []
+            for field in data["fields"]:
+                match field["kind"]:
+                    case "pair":
+                        pair = _build_pair(field)
+                        if is_valid_with_attributes(pair.attributes):
+                            fields.append(pair)
+                    case "spread":
+                        fields.append(
+                            SpreadField.model_construct(
+                                kind="spread", type=build_schema(field["type"])
+                            )
+                        )
+                    case kind:
+                        raise ValueError(f"Unknown struct field kind {kind!r}")
+
+            return StructSchema.model_construct(
+                kind="struct", fields=fields, attributes=attributes
+            )
+        case "enum":
+            if (enum_kind := data["enumKind"]) not in _ENUM_KINDS:
+                raise ValueError(f"Unknown enum kind {enum_kind!r}")
+
+            values = []
+            for value in data["values"]:
+                if type(value["value"]) is not str:
+                    raise ValueError(f"Enum value {value['value']!r} is not a string")
+                values.append(
+                    EnumValue.model_construct(
+                        desc=value.get("desc"),
+                        identifier=_expect_str(value["identifier"]),
+                        value=value["value"],
+                    )
+                )
+
+            return EnumSchema.model_construct(
+                kind="enum", enum_kind=enum_kind, values=values, attributes=attributes
+            )
+        case "dispatcher":
+            indices = []
+            for index in data["parallelIndices"]:
+                match index["kind"]:
+                    case "static":
+                        indices.append(
+                            StaticIndex.model_construct(
+                                kind="static", value=_expect_str(index["value"])
+                            )
+                        )
+                    case "dynamic":
+                        indices.append(
+                            DynamicIndex.model_construct(
+                                kind="dynamic", accessor=index["accessor"]
+                            )
+                        )
+                    case kind:
+                        raise ValueError(f"Unknown dispatcher index kind {kind!r}")
+
+            return DispatcherSchema.model_construct(
+                kind="dispatcher",
+                parallel_indices=indices,
+                registry=_expect_str(data["registry"]),
+                attributes=attributes,
+            )
+        case "literal":
+            return _build_literal(data, attributes)
+        case kind:
+            raise ValueError(f"Unknown schema kind {kind!r}")
+
+
+_ENUM_KINDS = frozenset({"byte", "short", "int", "long", "string", "float", "double"})
+
+
+def _build_pair(data: dict[str, Any]) -> PairField:
+    key = data["key"]
+    return PairField.model_construct(
+        kind="pair",
+        key=key if type(key) is str else build_schema(key),
+        type=build_schema(data["type"]),
+        optional=data.get("optional", False),
+        desc=data.get("desc"),
+        attributes=_build_attributes(data.get("attributes")),
+    )
+
+
+def _build_literal(
+    data: dict[str, Any], attributes: list[Attribute] | None = None
+) -> LiteralSchema:
+    raw = data["value"]
+    match raw["kind"]:
+        case "string":
+            value = StringLiteralValue.model_construct(
+                kind="string", value=raw["value"]
+            )
+        case "int":
+            value = IntLiteralValue.model_construct(kind="int", value=raw["value"])
+        case "boolean":
+            value = BooleanLiteralValue.model_construct(
+                kind="boolean", value=raw["value"]
+            )
+        case "byte" if raw["value"] in (0, 1):
+            value = ByteLiteralValue.model_construct(
+                kind="byte", value=bool(raw["value"])
+            )
+        case kind:
+            raise ValueError(f"Unsupported literal {kind!r}: {raw['value']!r}")
+
+    return LiteralSchema.model_construct(
+        kind="literal", value=value, attributes=attributes
+    )
+
+
+def _build_attributes(data: list[dict[str, Any]] | None) -> list[Attribute] | None:
+    if data is None:
+        return None
+
+    return [
+        Attribute.model_construct(
+            name=_expect_str(attribute["name"]),
+            value=_build_attribute_value(attribute.get("value")),
+        )
+        for attribute in data
+    ]
+
+
+def _build_attribute_value(data: dict[str, Any] | None) -> Any:
+    if data is None:
+        return None
+
+    match data["kind"]:
+        case "literal" | "reference" | "dispatcher":
+            return _build_root(data)
+        case "tree":
+            values = {}
+            for key, value in data["values"].items():
+                if value["kind"] not in ("literal", "reference"):
+                    raise ValueError(f"Unsupported tree value kind {value['kind']!r}")
+                values[_expect_str(key)] = _build_root(value)
+
+            return TreeSchema.model_construct(
+                kind="tree", values=TreeValue.model_construct(values)
+            )
+        case kind:
+            raise ValueError(f"Unsupported attribute value kind {kind!r}")
+
+
+def _expect_str(value: Any) -> str:
+    if type(value) is not str:
+        raise ValueError(f"Expected a string, got {value!r}")
+    return value
+
+
+def _build_range(data: dict[str, Any] | None) -> ValueRange | None:
+    if data is None:
+        return None
+
+    bounds = {}
+    for bound in ("min", "max"):
+        if (value := data.get(bound)) is not None:
+            # like pydantic's lax int, whole floats are fine, fractional ones aren't
+            if value != int(value):
+                raise ValueError(f"Range bound {value!r} is not an integer")
+            value = int(value)
+        bounds[bound] = value
+
+    return ValueRange.model_construct(kind=data["kind"], **bounds)
+
+
+def check_build_schema(symbols: dict[str, Any]) -> list[str]:
+    """
+    Compares `build_schema` against `Schema.model_validate` for every symbol, returning
+    the paths where they disagree (one fails but not the other, or the dumps differ).
+    """
+
+    mismatches = []
+    for path, data in symbols.items():
+        try:
+            expected = Schema.model_validate(data).model_dump()
+        except Exception:
+            expected = None
+        try:
+            built = build_schema(data).model_dump()
+        except Exception:
+            built = None
+
+        if expected != built:
+            mismatches.append(path)
+
+    return mismatches
+
+
 def create_schemas(data: dict[str, Any]) -> Iterable[tuple[str, Schema]]:
     for key, val in data.items():
-        yield key, Schema.model_validate(val)
+        yield key, build_schema(val)
 
 
 def beet_default(ctx: Context):
@@ -301,4 +558,6 @@ def beet_default(ctx: Context):
     ctx.meta["item_component_schemas"] = dict(
         create_schemas(mcdoc_file.data["mcdoc/dispatcher"]["minecraft:data_component"])
     )
+    # frozen once so fuzzy "did you mean?" lookups reuse the same choices
+    ctx.meta["item_component_names"] = tuple(ctx.meta["item_component_schemas"])
     ctx.meta["item_component_defaults"] = mcmeta_file.data
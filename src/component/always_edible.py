@@ -1,6 +1,6 @@
 from component.type import Component
 
-class AlwaysEdible(Component):
+class AlwaysEdible(Component, shared_cache=True):
     """This component binds always edible to the enchantment glint.
     
     Sets a subcomponent of `food` and enchantment_glint_override.
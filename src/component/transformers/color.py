@@ -3,13 +3,17 @@ from typing import Any
 from component.type import Transformer
 from lib.errors import CustomComponentError
 
+# deletes every hex digit, so anything left over after translating is invalid
+_HEX_DIGITS = str.maketrans("", "", "0123456789abcdefABCDEF")
+
 
 def parse_hex_color(color: str, component: Transformer) -> int:
     color = color.removeprefix("#")
 
     if len(color) == 8:
         color = color[:6]  # handles VSCode auto-picker adding transparency
-    elif len(color) != 6:
+
+    if len(color) != 6 or color.translate(_HEX_DIGITS):
         raise CustomComponentError(
             f"Color needs to be in form '#aabbcc' (received: '{color}')",
             component.name(),
@@ -51,6 +51,8 @@ so they're automatically discovered and applied during item resolution.
 TODO: rewrite with pydantic man
 """
 
+from collections.abc import Iterable, Mapping
+import sys
 from typing import Any, ClassVar, Self, TYPE_CHECKING
 from dataclasses import dataclass, field
 
@@ -76,7 +78,7 @@ class RecursiveComponent:
     data: Any
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class Component:
     """Base class for custom item components.
 
@@ -88,7 +90,8 @@ class Component:
 
     - **registered**: Class variable tracking all registered components
     - **item**: The item class this component is being applied to
-    - **resolved_components**: All components resolved so far (for context)
+    - **resolved_components**: Read-only view of all components resolved so far
+      (for context). Copy it if you need a snapshot or want to modify it.
 
     ## Subclassing
 
@@ -104,37 +107,76 @@ class Component:
             ...
 
     This is useful for components that depend on runtime state.
+
+    Components whose `build()` depends only on their own fields (not on `item`,
+    `resolved_components`, or side effects like generating functions) can share
+    their output between every item using the same data:
+
+        class MyComponent(Component, shared_cache=True):
+            ...
     """
 
     registered: ClassVar[list[Self]] = []
+    registered_by_name: ClassVar[dict[str, type[Self]]] = {}
 
     item: "ItemType" = field(kw_only=True)
-    resolved_components: dict[str, Any] = field(kw_only=True)
-
-    def __init_subclass__(cls, cache: bool = True, base_type: type | None = None):
+    resolved_components: Mapping[str, Any] = field(kw_only=True)
+
+    def __init_subclass__(
+        cls,
+        cache: bool = True,
+        shared_cache: bool = False,
+        base_type: type | None = None,
+    ):
         """Auto-register component and convert to dataclass."""
+        # interned since it's used as a dict key for every item using the component
+        cls._name = sys.intern(camel_case_to_snake_case(cls.__name__))
+
         if cls.__name__ in {"Transformer", "GlobalTransformer"}:
             # Don't register the transformer base classes as custom components.
             return super().__init_subclass__()
 
         cls._skip_cache = not cache
+        cls._shared_cache = cache and shared_cache
         cls._base_type = base_type
         cls.__annotations__  # just access it to catch any Annotated type errors early
 
         if base_type is not None:
             cls.__annotations__["base_type"] = cls._base_type
 
-        new_cls = dataclass(cls, repr=False)
+        # identity equality: components hold the item and every resolved component,
+        # so a generated field-by-field __eq__ would recurse through all of them
+        new_cls = dataclass(cls, repr=False, eq=False)
         new_cls.__module__ = cls.__module__
         new_cls.path = property(Component.path)
+        # most components don't override the hook, so the item can skip calling it
+        new_cls._has_post_build = new_cls.post_build is not Component.post_build
 
+        new_cls._registration_index = len(cls.registered)
         cls.registered.append(new_cls)
+        # the first registration wins, later ones with the same name never see data
+        cls.registered_by_name.setdefault(new_cls._name, new_cls)
         return new_cls
 
+    @classmethod
+    def registered_for(cls, components: Iterable[str]) -> list[type[Self]]:
+        """Get the registered classes named in `components` (e.g. a component dict's
+        keys), in registration order.
+
+        Only the first component registered under a name is returned. Keys added by
+        a component's `build()` output are matched again by the item, so components
+        registered later still get built.
+        """
+        registry = cls.registered_by_name
+        return sorted(
+            (registry[name] for name in components if name in registry),
+            key=lambda component: component._registration_index,
+        )
+
     @classmethod
     def name(cls) -> str:
         """Get the snake_case name of this component."""
-        return camel_case_to_snake_case(cls.__name__)
+        return cls._name
 
     def path(self) -> str:
         return f"{self.item.path}/components/{self.name()}"
@@ -172,7 +214,7 @@ class Component:
         return f"{self.__class__.__name__}({field_str})"
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class Transformer(Component):
     """Base class for component value transformers.
 
@@ -183,7 +225,8 @@ class Transformer(Component):
 
     - **registered**: Class variable tracking all registered transformers
     - **item**: The item class this transformer is being applied to
-    - **resolved_components**: All components resolved so far (for context)
+    - **resolved_components**: Read-only view of all components resolved so far
+      (for context)
 
     ## Subclassing
 
@@ -209,6 +252,7 @@ class Transformer(Component):
     """
 
     registered: ClassVar[list[Self]] = []  # Separate registry for transformers
+    registered_by_name: ClassVar[dict[str, type[Self]]] = {}
 
     def build(self) -> TransformerOutput:
         """Transform this component's value.
@@ -218,7 +262,7 @@ class Transformer(Component):
         raise NotImplementedError
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, eq=False)
 class GlobalTransformer(Component):
     """Base class for transformers that inspect all resolved components.
 
@@ -229,6 +273,7 @@ class GlobalTransformer(Component):
     """
 
     registered: ClassVar[list[Self]] = []
+    registered_by_name: ClassVar[dict[str, type[Self]]] = {}
 
     def build(self) -> BuildOutput:
         """Return components to merge into the resolved output.
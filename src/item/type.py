@@ -6,17 +6,20 @@ vanilla and custom components to build complex items with ease.
 """
 
 import dataclasses
+import heapq
+from functools import cache, partial
 from json import JSONEncoder
 import json
-import traceback
-from typing import Any, ClassVar, Self
+import os
+import sys
+from typing import Any, ClassVar, Self, TYPE_CHECKING
 from itertools import chain, count
 from collections import deque
+from collections.abc import Callable
+from types import MappingProxyType
 
 from beet import Context
 from bolt import Runtime
-import difflib
-import pprint
 
 from bolt_expressions.sources import Source
 
@@ -29,8 +32,11 @@ from component.type import (
 )
 from lib.helpers import (
     camel_case_to_snake_case,
+    close_matches,
     coerce_type,
+    compile_type_check,
     copy_with_sources,
+    freeze,
     nbt_dump,
     deep_merge_dicts,
     check_type,
@@ -46,11 +52,193 @@ from lib.errors import (
     CustomComponentError,
     MissingValidationError,
     ComponentTypeError,
+    SourceInfo,
 )
 from lib.component_validation import McdocValidator, SchemaFile
-from lib.rich import console, Tree, Syntax, Group, Panel, RenderableType, Text
 from lib.types import Remove
 
+if TYPE_CHECKING:
+    # rich is only needed to render errors and debug output, so it's imported lazily
+    from lib.rich import Tree, RenderableType
+
+
+_MISSING = dataclasses.MISSING
+_METHOD_DESCRIPTORS = (classmethod, staticmethod)
+_SCHEMALESS_COMPONENTS = frozenset({"custom_data", "minecraft:custom_data"})
+
+# serialized `key=value` parts for scalar components, keyed by (key, type, value)
+_NBT_SCALARS = frozenset({str, int, float, bool})
+_scalar_component_strings: dict[tuple[str, type, Any], str] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class _ComponentFields:
+    """User-facing dataclass fields of a component, introspected once per class."""
+
+    fields: tuple[dataclasses.Field, ...]
+    field_map: dict[str, dataclasses.Field]
+    has_required: bool
+    # (name, type, type check, default, default_factory) per field, unpacked in the
+    # validation loop
+    specs: tuple[tuple[str, Any, Callable[[Any], bool], Any, Any], ...]
+
+
+@cache
+def _component_fields(component: type[Component | Transformer]) -> _ComponentFields:
+    fields = tuple(
+        field
+        for field in dataclasses.fields(component)
+        if field.name not in ("item", "resolved_components", "base_type")
+    )
+    return _ComponentFields(
+        fields=fields,
+        field_map={field.name: field for field in fields},
+        has_required=any(
+            field.default is _MISSING and field.default_factory is _MISSING
+            for field in fields
+        ),
+        specs=tuple(
+            (
+                field.name,
+                field.type,
+                compile_type_check(field.type),
+                field.default,
+                field.default_factory,
+            )
+            for field in fields
+        ),
+    )
+
+
+# nobody reads pages of JSON for a validation error, so long dumps get cut off
+_MAX_COMPONENT_DUMP = 4096
+
+# entries kept per validation cache before the least recently used ones are evicted
+_VALIDATION_CACHE_SIZE = 8192
+
+
+def _lru_store(cache: dict, key: Any, value: Any):
+    """Store `value` in a size-bounded cache, evicting the least recently used entry.
+
+    Dicts keep insertion order and callers pop hits before storing them again, so
+    the first key is always the least recently used one.
+    """
+    cache[key] = value
+    if len(cache) > _VALIDATION_CACHE_SIZE:
+        del cache[next(iter(cache))]
+
+
+def _dump_component(component: Any) -> str:
+    """Pretty-print a component value for error output."""
+    dump = json.dumps(component, indent=2, cls=ItemTypeEncoder)
+
+    if len(dump) > _MAX_COMPONENT_DUMP:
+        return dump[:_MAX_COMPONENT_DUMP] + "\n..."
+    return dump
+
+
+def _render_type_error(tree: "Tree", error: ComponentTypeError):
+    tree.add(
+        f"[red]Wrong type:[/red] Expected [x]{pretty_type(error.expected)!r}[/x] but got [x]{pretty_type(error.actual_type)!r}[/x]"
+    )
+    tree.add(
+        f"[yellow]💡 Hint:[/yellow] This component should be a 'dict' with multiple fields, not a {pretty_type(error.actual_type)!r}"
+    )
+
+
+def _render_unexpected(tree: "Tree", error: UnexpectedValidationError):
+    msg = f" ({error.msg})" if error.msg else ""
+    tree.add(f"Unexpected field [x]{error.name!r}[/x]{msg}")
+
+
+def _render_missing(tree: "Tree", error: MissingValidationError):
+    msg = f" ({error.msg})" if error.msg else ""
+    tree.add(
+        f"Missing field [x]{error.name!r}[/x] (expected type [x]{pretty_type(error.expected)!r}[/x]){msg}"
+    )
+
+
+def _render_validation(tree: "Tree", error: ValidationError):
+    msg = f" ({error.msg})" if error.msg else ""
+    subtree = tree.add(
+        f"Expected [x]{error.name!r}[/x] as type [x]{pretty_type(error.expected)!r}[/x]{msg}"
+    )
+    _render_suberrors(subtree, error.suberrors)
+
+
+def _render_recursion(tree: "Tree", error: RecursionError):
+    raise error
+
+
+def _render_group(tree: "Tree", error: ExceptionGroup):
+    subtree = tree.add(error.args[0])
+    _render_suberrors(subtree, error.exceptions)
+
+
+def _render_exception(tree: "Tree", error: Exception):
+    import traceback
+
+    err_tree = tree.add(f"[x]{pretty_type(type(error))}[/x]: {error}")
+    tb = "\n".join(traceback.format_exception(error)).strip()
+    err_tree.add(f"[dim]{tb}[/dim]")
+
+
+# Exact error type -> renderer. Subclasses are resolved along their MRO on first
+# sight and memoized here, so the most specific renderer always wins.
+_SUBERROR_RENDERERS: dict[type, Callable[["Tree", Any], None]] = {
+    ComponentTypeError: _render_type_error,
+    UnexpectedValidationError: _render_unexpected,
+    MissingValidationError: _render_missing,
+    ValidationError: _render_validation,
+    RecursionError: _render_recursion,
+    ExceptionGroup: _render_group,
+}
+
+
+def _render_suberrors(tree: "Tree", suberrors: list[ValidationError | Exception]):
+    """Recursively render validation errors in a tree structure."""
+    for suberror in suberrors:
+        error_type = type(suberror)
+        if (renderer := _SUBERROR_RENDERERS.get(error_type)) is None:
+            renderer = next(
+                (
+                    _SUBERROR_RENDERERS[base]
+                    for base in error_type.__mro__
+                    if base in _SUBERROR_RENDERERS
+                ),
+                _render_exception,
+            )
+            _SUBERROR_RENDERERS[error_type] = renderer
+
+        renderer(tree, suberror)
+
+
+def _plain_suberrors(
+    suberrors: list[ValidationError | Exception], indent: str = "    "
+) -> list[str]:
+    """Plain text version of `_render_suberrors`, one line per (nested) suberror."""
+    lines = []
+    for suberror in suberrors:
+        msg = f" ({suberror.msg})" if getattr(suberror, "msg", "") else ""
+        nested: list[ValidationError | Exception] = []
+        match suberror:
+            case ComponentTypeError(expected=expected, actual_type=actual_type):
+                line = f"Wrong type: Expected {pretty_type(expected)!r} but got {pretty_type(actual_type)!r}"
+            case UnexpectedValidationError(name=name):
+                line = f"Unexpected field {name!r}{msg}"
+            case MissingValidationError(name=name, expected=expected):
+                line = f"Missing field {name!r} (expected type {pretty_type(expected)!r}){msg}"
+            case ValidationError(name=name, expected=expected, suberrors=nested):
+                line = f"Expected {name!r} as type {pretty_type(expected)!r}{msg}"
+            case ExceptionGroup():
+                line, nested = suberror.args[0], list(suberror.exceptions)
+            case _:
+                line = f"{pretty_type(type(suberror))}: {suberror}"
+
+        lines.append(f"{indent}- {line}")
+        lines.extend(_plain_suberrors(nested, indent + "  "))
+    return lines
+
 
 @dataclasses.dataclass(frozen=True)
 class ItemStack:
@@ -148,12 +336,36 @@ class ItemType(type):
     registered_items: ClassVar[dict[str, "ItemType"]] = {}
     counter: ClassVar[count] = count()
 
+    # validation results shared across items, keyed by (name, frozen value, base_type).
+    # Both validation caches are LRUs bounded by `_VALIDATION_CACHE_SIZE`.
+    _validation_cache: ClassVar[
+        dict[tuple[str, Any, type | None], ComponentError | None]
+    ] = {}
+    # build outputs of `shared_cache` components, keyed by (name, frozen data)
+    _shared_component_cache: ClassVar[dict[tuple[str, Any], Any]] = {}
+
+    # the same value objects (e.g. inherited scalars) are often validated repeatedly,
+    # so check by identity before paying for `freeze`. Entries hold a reference to
+    # the value so its id can't be reused while cached.
+    _validation_identity_cache: ClassVar[
+        dict[tuple[str, int, type | None], tuple[Any, ComponentError | None]]
+    ] = {}
+    # the schemas the validation caches were filled against
+    _validation_schemas: ClassVar[SchemaFile | None] = None
+    # schema validators bound per vanilla component name (None if it doesn't exist)
+    _component_validators: ClassVar[dict[str, Callable[[Any], None] | None]] = {}
+
     # monkeypatched in base.bolt
     ctx: ClassVar[Context]
 
     _namespace: dict[str, Any]
+    _name: str
 
     def __new__(cls, name: str, bases: list[type], namespace: dict[str, Any]):
+        # `name` is read all over the build (custom_data, paths, predicates), so it's
+        # converted (and interned) once here rather than on every access
+        namespace["_name"] = sys.intern(camel_case_to_snake_case(name))
+
         # Skip base Item class as it's not designed to be actually in-game
         if name == "item":
             return super().__new__(cls, name, bases, namespace)
@@ -165,11 +377,15 @@ class ItemType(type):
 
         namespace["_component_cache"] = {}
         namespace["_has_errored"] = False
-        namespace["_components"] = {}
+        namespace["_components"] = None
         namespace["_custom_components"] = {}
         namespace["_custom_transformers"] = {}
         namespace["_global_transformers"] = {}
         namespace["_component_sources"] = {}
+        namespace["_item_string"] = None
+        namespace["_conditional_string"] = None
+        namespace["_exact_conditional_string"] = None
+        namespace["_dict_components"] = None
 
         cls.registered_items[name] = new_cls = super().__new__(
             cls, name, bases, namespace
@@ -195,76 +411,59 @@ class ItemType(type):
         Returns:
             Tuple of (reconstructed_data, field_errors)
         """
-        fields = [
-            field
-            for field in dataclasses.fields(component)
-            if field.name not in ("item", "resolved_components", "base_type")
-        ]
+        component_fields = _component_fields(component)
+        fields = component_fields.fields
+        specs = component_fields.specs
+        field_map = component_fields.field_map
         field_errors: list[ValidationError] = []
         reconstructed_data = {}
 
-        # Build field lookup for easier access
-        field_map = {field.name: field for field in fields}
-
-        # Early type check: if we have multiple fields and data is not a dict,
-        # check if data matches any single field type. If not, this is likely
-        # a type error at the component level.
-        if len(fields) > 1 and not check_type(data, dict):
-            # Check if data matches any single field type
-            matches_any_field = any(check_type(data, field.type) for field in fields)
-
-            # If data doesn't match any field type and we need a dict, report type error
-            if not matches_any_field:
-                # Count how many fields are required (no default)
-                required_fields = [
-                    f
-                    for f in fields
-                    if f.default is dataclasses.MISSING
-                    and f.default_factory is dataclasses.MISSING
-                ]
+        is_dict = isinstance(data, dict)
 
-                # If we have required fields, this is definitely a type error
-                if required_fields:
-                    field_errors.append(
-                        ComponentTypeError(
-                            "component",
-                            data,
-                            dict,
-                            type(data),
-                        )
-                    )
-                    return reconstructed_data, field_errors
-
-        # Handle simple case: data itself matches a field type
-        for field in fields:
+        for name, field_type, type_check, default, default_factory in specs:
             # Handle dict case: validate each field
-            if check_type(data, dict):
-                if (value := data.get(field.name)) is None:
+            if is_dict:
+                if (value := data.get(name)) is None:
                     # Check if field has a default value
-                    if field.default is not dataclasses.MISSING:
-                        reconstructed_data[field.name] = field.default
-                    elif field.default_factory is not dataclasses.MISSING:
-                        reconstructed_data[field.name] = field.default_factory()
+                    if default is not _MISSING:
+                        reconstructed_data[name] = default
+                    elif default_factory is not _MISSING:
+                        reconstructed_data[name] = default_factory()
                     else:
                         field_errors.append(
-                            MissingValidationError(field.name, None, field.type)
+                            MissingValidationError(name, None, field_type)
                         )
-                elif not check_type(value, field.type):
-                    field_errors.append(ValidationError(field.name, value, field.type))
+                elif not type_check(value):
+                    field_errors.append(ValidationError(name, value, field_type))
                 else:
-                    reconstructed_data[field.name] = value
-                continue
-
-            if check_type(data, field.type):
-                reconstructed_data[field.name] = data
-                continue
-
-        # Check for unexpected keys (only for dict data)
-        if component._base_type is None and check_type(data, dict):
-            unexpected_keys = set(data.keys()) - set(reconstructed_data.keys())
-            for key in unexpected_keys:
+                    reconstructed_data[name] = value
+
+            # Handle simple case: data itself matches a field type
+            elif type_check(data):
+                reconstructed_data[name] = data
+
+        # If we have multiple fields, data is not a dict and it matched none of the
+        # field types, then this is a type error at the component level (as long as
+        # any of the fields are required).
+        if (
+            len(fields) > 1
+            and not is_dict
+            and not reconstructed_data
+            and component_fields.has_required
+        ):
+            return {}, [ComponentTypeError("component", data, dict, type(data))]
+
+        # Check for unexpected keys (only for dict data). The keys view comparison runs
+        # in C, so the per-key loop only runs when there's something to report (and
+        # keeps the reported keys in definition order).
+        if (
+            component._base_type is None
+            and is_dict
+            and not data.keys() <= field_map.keys()
+        ):
+            for key, value in data.items():
                 if key not in field_map:
-                    field_errors.append(UnexpectedValidationError(key, data[key]))
+                    field_errors.append(UnexpectedValidationError(key, value))
 
         # Check basetype
         if component._base_type is not None:
@@ -290,6 +489,10 @@ class ItemType(type):
     ) -> ComponentError | None:
         """Validate a component against its mcdoc schema or base_type.
 
+        Many items share identical component values, so results are cached by value
+        (in bounded LRUs) until the loaded schemas change. Values that can't be frozen into a key (such
+        as bolt expression sources) are always validated.
+
         Args:
             component_name: Name of the component (e.g., "minecraft:item_name")
             component: Component value to validate
@@ -298,10 +501,41 @@ class ItemType(type):
         Returns:
             ComponentError if validation fails, None if valid
         """
-        # custom_data has no schema
-        if "custom_data" in component_name:
+        # custom_data has no schema (and is unique per item, so not worth caching)
+        if component_name in _SCHEMALESS_COMPONENTS:
             return
 
+        # results only hold for the schemas they were validated against
+        schemas = cls.ctx.meta["item_component_schemas"]
+        if schemas is not cls._validation_schemas:
+            cls._validation_cache.clear()
+            cls._validation_identity_cache.clear()
+            cls._component_validators.clear()
+            cls._validation_schemas = schemas
+
+        identity_key = (component_name, id(component), base_type)
+        identity_cache = cls._validation_identity_cache
+        if (entry := identity_cache.pop(identity_key, None)) is not None:
+            if entry[0] is component:
+                identity_cache[identity_key] = entry
+                return entry[1]
+
+        try:
+            key = (component_name, freeze(component), base_type)
+        except TypeError:
+            return cls._validate_component(component_name, component, base_type)
+
+        if (error := cls._validation_cache.pop(key, _MISSING)) is _MISSING:
+            error = cls._validate_component(component_name, component, base_type)
+        _lru_store(cls._validation_cache, key, error)
+
+        _lru_store(identity_cache, identity_key, (component, error))
+        return error
+
+    @classmethod
+    def _validate_component(
+        cls, component_name: str, component: Any, base_type: type | None = None
+    ) -> ComponentError | None:
         # If base_type is provided, use it for validation instead of schema
         if base_type is not None:
             if not check_type(component, base_type):
@@ -316,20 +550,12 @@ class ItemType(type):
                 )
             return
 
-        mcdoc_validator = cls.ctx.inject(McdocValidator)
-
         if component is Remove:
             return
 
-        # we get a cached schema from lib:component_validation
-        schemas: SchemaFile = cls.ctx.meta["item_component_schemas"]
-        if (schema := schemas.get(component_name)) is not None:
+        if (validator := cls.component_validator(component_name)) is not None:
             try:
-                mcdoc_validator.validate_data(
-                    component,
-                    schema,
-                    [component_name],
-                )
+                validator(component)
             except ValidationError as err:
                 return ComponentError(component_name, component, [err])
             except ExceptionGroup as err:
@@ -340,10 +566,38 @@ class ItemType(type):
             return
 
         # Component doesn't exist, suggest alternatives
-        suggestions = difflib.get_close_matches(
-            component_name, schemas.keys(), n=3, cutoff=0.6
+        suggestions = close_matches(
+            component_name, cls.ctx.meta["item_component_names"], n=3, cutoff=0.6
         )
-        return NonExistentComponentError(component_name, suggestions=suggestions)
+        return NonExistentComponentError(component_name, suggestions=list(suggestions))
+
+    @classmethod
+    def component_validator(cls, component_name: str) -> Callable[[Any], None] | None:
+        """Get the schema validator for a vanilla component.
+
+        The schema lookup and validator are resolved once per component name, rather
+        than for every item using it.
+
+        Returns:
+            Callable raising on invalid data, None if the component doesn't exist
+        """
+        try:
+            return cls._component_validators[component_name]
+        except KeyError:
+            pass
+
+        # we get a cached schema from lib:component_validation
+        schemas: SchemaFile = cls.ctx.meta["item_component_schemas"]
+        validator = None
+        if (schema := schemas.get(component_name)) is not None:
+            validator = partial(
+                cls.ctx.inject(McdocValidator).validate_data,
+                schema=schema,
+                path=[component_name],
+            )
+
+        cls._component_validators[component_name] = validator
+        return validator
 
     def handle_custom_components(
         self,
@@ -370,11 +624,25 @@ class ItemType(type):
         constructed_components: list[Component] = []
         errors: list[CustomComponentError] = []
         output_component_mapping: dict[str, Component] = {}
-
-        components_queue = deque((component, False) for component in custom_components)
-
-        while components_queue:
-            component, force_build = components_queue.popleft()
+        merged_names: list[str] = []
+        # a proxy is a live read-only view, so one is enough for every component
+        resolved_view = MappingProxyType(resolved_components)
+
+        # registered components in registration order, then recursive invocations.
+        # Outputs can add keys for later registered components, so it's a heap.
+        components_heap = [
+            (component._registration_index, component) for component in custom_components
+        ]
+        heapq.heapify(components_heap)
+        queued_names = {component.name() for component in custom_components}
+        recursive_queue: deque[type[Component]] = deque()
+
+        while components_heap or recursive_queue:
+            if components_heap:
+                _, component = heapq.heappop(components_heap)
+                force_build = False
+            else:
+                component, force_build = recursive_queue.popleft(), True
             name = component.name()
 
             try:
@@ -397,19 +665,38 @@ class ItemType(type):
                         data, component
                     )
 
-                    # Raise validation error if fields are invalid
+                    # Report invalid fields directly, exceptions are reserved for build failures
                     if field_errors:
-                        raise ComponentError(name, data, field_errors)
+                        errors.append(ComponentError(name, data, field_errors))
+                        continue
 
                     # Attempt to instantiate and builder the component
                     try:
                         # TODO: convert to pydantic ;_;
                         constructed_component: Component = component(
                             item=self,
-                            resolved_components=dict(resolved_components),
+                            resolved_components=resolved_view,
                             **reconstructed_data,
                         )
-                        output = constructed_component.build()
+
+                        # Item-independent components can reuse output built for
+                        # another item with the same data.
+                        shared_key = None
+                        if component._shared_cache and not force_build:
+                            try:
+                                shared_key = (name, freeze(data))
+                            except TypeError:
+                                pass
+
+                        shared = self._shared_component_cache.get(shared_key)
+                        if shared is not None:
+                            output = copy_with_sources(shared)
+                        else:
+                            output = constructed_component.build()
+                            if shared_key is not None:
+                                self._shared_component_cache[shared_key] = (
+                                    copy_with_sources(output)
+                                )
 
                         if output:
                             for key, value in output.items():
@@ -417,7 +704,7 @@ class ItemType(type):
                                     # If we have a recursive component, we need to add it back to the queue
                                     # so that it gets processed as a normal component. We also need to merge
                                     # its output into the current output (replacing the wrapper.)
-                                    components_queue.append((value.component, True))
+                                    recursive_queue.append(value.component)
                                     output[key] = value.data
 
                         constructed_components.append(constructed_component)
@@ -438,11 +725,8 @@ class ItemType(type):
 
                 # Merge component output into resolved_components
                 if output is not None:
-                    # Track original component data in custom_data for runtime access
-                    metadata = {"component": {name: {}}}
-                    resolved_components["custom_data"] = deep_merge_dicts(
-                        resolved_components.get("custom_data", {}), metadata
-                    )
+                    # Tracked in custom_data once every component is merged (below)
+                    merged_names.append(name)
 
                     # Track base_type component
                     if constructed_component.__class__._base_type is not None:
@@ -451,9 +735,31 @@ class ItemType(type):
                     # Merge built vanilla components
                     deep_merge_dicts(resolved_components, output, inplace=True)
 
+                    # Keys for components registered after this one still get built,
+                    # as they would in a pass over every registered component
+                    if not force_build and not output.keys() <= queued_names:
+                        for added in component.registered_for(
+                            output.keys() - queued_names
+                        ):
+                            queued_names.add(added.name())
+                            if added._registration_index > component._registration_index:
+                                heapq.heappush(
+                                    components_heap, (added._registration_index, added)
+                                )
+
             except ComponentError as err:
                 errors.append(err)
 
+        # Track original component data in custom_data for runtime access, in one
+        # go rather than per component. Entries merged in by component outputs win.
+        # The `component` dict is rebuilt rather than mutated since it may be shared
+        # with a previously merged (and possibly cached) output.
+        if merged_names:
+            custom_data = resolved_components.setdefault("custom_data", {})
+            component = {name: {} for name in merged_names}
+            component.update(custom_data.get("component", {}))
+            custom_data["component"] = component
+
         return constructed_components, errors, output_component_mapping
 
     def handle_custom_transformers(
@@ -478,6 +784,7 @@ class ItemType(type):
         """
         errors = []
         constructed_transformers = []
+        resolved_view = MappingProxyType(resolved_components)
 
         for transformer in custom_transformers:
             name: str = transformer.name()
@@ -495,15 +802,16 @@ class ItemType(type):
                     data, transformer
                 )
 
-                # Raise validation error if fields are invalid
+                # Report invalid fields directly, exceptions are reserved for build failures
                 if field_errors:
-                    raise ComponentError(name, data, field_errors)
+                    errors.append(ComponentError(name, data, field_errors))
+                    continue
 
                 # Attempt to instantiate and build the transformer
                 try:
                     constructed_transformer = transformer(
                         item=self,
-                        resolved_components=dict(resolved_components),
+                        resolved_components=resolved_view,
                         **reconstructed_data,
                     )
                     transformed_value = constructed_transformer.build()
@@ -540,6 +848,7 @@ class ItemType(type):
         """
         errors = []
         constructed_transformers = []
+        resolved_view = MappingProxyType(resolved_components)
 
         for transformer in global_transformers:
             name = transformer.name()
@@ -548,7 +857,7 @@ class ItemType(type):
                 try:
                     constructed_transformer = transformer(
                         item=self,
-                        resolved_components=dict(resolved_components),
+                        resolved_components=resolved_view,
                     )
                     output = constructed_transformer.build()
 
@@ -591,43 +900,58 @@ class ItemType(type):
         Returns:
             Dict of resolved vanilla Minecraft components
         """
-        # Return cached components if available
-        if self._components:
+        # Return cached components if available (an item may legitimately resolve
+        # to no components, so check against None rather than truthiness)
+        if self._components is not None:
             return self._components
 
         # Phase 1: Discovery - find all component definitions
-        original_components = {}
-        for member in dir(self):
-            # Skip private members and callables
-            if member.startswith("_"):
-                continue
+        # Walk the class namespaces directly rather than `dir()` + `getattr()`, which
+        # also collects every inherited dunder and goes through the descriptor protocol
+        # for each name. The first class in the MRO to define a name wins, just like
+        # attribute lookup. Names stay sorted so the output order is stable.
+        members: dict[str, Any] = {}
+        for klass in self.__mro__[:-1]:  # `object` only holds dunders
+            for member, val in vars(klass).items():
+                if not member.startswith("_"):
+                    members.setdefault(member, val)
 
-            if (val := getattr(self, member)) is not None:
+        original_components = {}
+        for member in sorted(members):
+            # Skip callables (raw namespace values can also be method descriptors)
+            if (val := members[member]) is not None:
                 if val is Remove:
                     original_components[member] = Remove
 
-                elif not callable(val):
+                elif not callable(val) and not isinstance(val, _METHOD_DESCRIPTORS):
                     # Deep copy to prevent mutations
                     original_components[member] = copy_with_sources(val)
 
                     # Track source for error messages
-                    self._component_sources[member] = {
-                        "class": self.__name__,
-                        "module": self.__module__,
-                        "original_value": val,
-                    }
-
-        # Phase 2: Initialize with item metadata
-        output_components = deep_merge_dicts(
-            original_components, {"custom_data": self.item_custom_data}, inplace=False
-        )
+                    self._component_sources[member] = SourceInfo(
+                        self.__name__, self.__module__, val
+                    )
+
+        # Phase 2: Initialize with item metadata. Discovery already copied every
+        # value, so only the top level (and custom_data, which we merge into) needs
+        # a fresh dict here rather than a second deep copy of everything.
+        output_components = dict(original_components)
+        if isinstance(custom_data := output_components.get("custom_data"), dict):
+            # a shallow copy keeps `original_components` intact for error reports;
+            # nested dicts are never merged in place, so it's safe to merge into
+            output_components["custom_data"] = custom_data = dict(custom_data)
+            deep_merge_dicts(custom_data, self.item_custom_data, inplace=True)
+        else:
+            output_components["custom_data"] = self.item_custom_data
 
         # Phase 3: Apply custom components and per-component transformers
         custom_components, component_errors, custom_component_mapping = (
-            self.handle_custom_components(Component.registered, output_components)
+            self.handle_custom_components(
+                Component.registered_for(output_components), output_components
+            )
         )
         custom_transformers, transformer_errors = self.handle_custom_transformers(
-            Transformer.registered, output_components
+            Transformer.registered_for(output_components), output_components
         )
 
         # Phase 4: Extract special fields (id isn't component data)
@@ -636,7 +960,8 @@ class ItemType(type):
 
         # Phase 5: Allow components and per-component transformers to post-process
         for component_or_transformer in chain(custom_components, custom_transformers):
-            component_or_transformer.post_build(output_components, self)
+            if component_or_transformer._has_post_build:
+                component_or_transformer.post_build(output_components, self)
 
         # Phase 6: Apply global transformers after all component post-build hooks
         global_transformers, global_transformer_errors = (
@@ -647,7 +972,8 @@ class ItemType(type):
 
         # Phase 7: Allow global transformers to post-process
         for transformer in global_transformers:
-            transformer.post_build(output_components, self)
+            if transformer._has_post_build:
+                transformer.post_build(output_components, self)
 
         # Phase 8: Validate and collect errors
         if not self._has_errored:
@@ -675,46 +1001,35 @@ class ItemType(type):
 
     def format_error_summary(self, errors: list[ComponentError]) -> str:
         """Generate a one-line summary of all errors"""
+        summaries = self.summarize_errors(errors)
+        return " | ".join(summaries) if summaries else "unknown errors"
+
+    def summarize_errors(self, errors: list[ComponentError]) -> list[str]:
+        """Generate a short summary line per errored component"""
         summaries = []
         for error in errors:
             match error:
                 case NonExistentComponentError(name=name):
                     summaries.append(f"{name}: doesn't exist")
                 case ComponentError(name=name, suberrors=suberrors):
-                    # Count error types
-                    type_errors = sum(
-                        1 for e in suberrors if isinstance(e, ComponentTypeError)
-                    )
-                    missing = sum(
-                        1 for e in suberrors if isinstance(e, MissingValidationError)
-                    )
-                    wrong_type = sum(
-                        1
-                        for e in suberrors
-                        if isinstance(e, ValidationError)
-                        and not isinstance(
-                            e,
-                            (
-                                MissingValidationError,
-                                UnexpectedValidationError,
-                                ComponentTypeError,
-                            ),
-                        )
-                    )
-                    unexpected = sum(
-                        1 for e in suberrors if isinstance(e, UnexpectedValidationError)
-                    )
-                    build_errors = sum(
-                        1 for e in suberrors if isinstance(e, ComponentBuildError)
-                    )
-                    other = (
-                        len(suberrors)
-                        - missing
-                        - wrong_type
-                        - unexpected
-                        - type_errors
-                        - build_errors
-                    )
+                    # Count error types in a single pass. Order matters since the
+                    # specific errors all subclass ValidationError.
+                    type_errors = missing = wrong_type = unexpected = 0
+                    build_errors = other = 0
+                    for suberror in suberrors:
+                        match suberror:
+                            case ComponentTypeError():
+                                type_errors += 1
+                            case MissingValidationError():
+                                missing += 1
+                            case UnexpectedValidationError():
+                                unexpected += 1
+                            case ValidationError():
+                                wrong_type += 1
+                            case ComponentBuildError():
+                                build_errors += 1
+                            case _:
+                                other += 1
 
                     parts = []
                     if type_errors:
@@ -732,7 +1047,7 @@ class ItemType(type):
 
                     summaries.append(f"{name}: {', '.join(parts)}")
 
-        return " | ".join(summaries) if summaries else "unknown errors"
+        return summaries
 
     def calculate_errors(
         self,
@@ -768,57 +1083,6 @@ class ItemType(type):
             if component.__class__._base_type is not None:
                 component_base_types[component_name] = component.__class__._base_type
 
-        def handle_suberrors(tree: Tree, suberrors: list[ValidationError | Exception]):
-            """Recursively render validation errors in a tree structure."""
-            for suberror in suberrors:
-                match suberror:
-                    case ComponentTypeError(
-                        expected=expected,
-                        actual_type=actual_type,
-                    ):
-                        tree.add(
-                            f"[red]Wrong type:[/red] Expected [x]{pretty_type(expected)!r}[/x] but got [x]{pretty_type(actual_type)!r}[/x]"
-                        )
-                        tree.add(
-                            f"[yellow]💡 Hint:[/yellow] This component should be a 'dict' with multiple fields, not a {pretty_type(actual_type)!r}"
-                        )
-                    case UnexpectedValidationError(
-                        name=name,
-                        msg=msg,
-                    ):
-                        msg = f" ({msg})" if msg else ""
-                        tree.add(f"Unexpected field [x]{name!r}[/x]{msg}")
-                    case MissingValidationError(
-                        name=name,
-                        expected=expected,
-                        suberrors=suberrors,
-                        msg=msg,
-                    ):
-                        msg = f" ({msg})" if msg else ""
-                        tree.add(
-                            f"Missing field [x]{name!r}[/x] (expected type [x]{pretty_type(expected)!r}[/x]){msg}"
-                        )
-                    case ValidationError(
-                        name=name,
-                        expected=expected,
-                        suberrors=suberrors,
-                        msg=msg,
-                    ):
-                        msg = f" ({msg})" if msg else ""
-                        subtree = tree.add(
-                            f"Expected [x]{name!r}[/x] as type [x]{pretty_type(expected)!r}[/x]{msg}"
-                        )
-                        handle_suberrors(subtree, suberrors)
-                    case RecursionError() as err:
-                        raise err
-                    case ExceptionGroup(exceptions=errors) as err:
-                        subtree = tree.add(err.args[0])
-                        handle_suberrors(subtree, errors)
-                    case err:
-                        err_tree = tree.add(f"[x]{pretty_type(type(err))}[/x]: {err}")
-                        tb = "\n".join(traceback.format_exception(err)).strip()
-                        err_tree.add(f"[dim]{tb}[/dim]")
-
         for name, component in output_components.items():
             # Only use base_type validation for components that explicitly set it
             base_type = None  # Default to None for safety
@@ -828,6 +1092,14 @@ class ItemType(type):
                 errors.append(error)
 
         if errors:
+            from lib.rich import console, Tree, Group, Panel, Text
+
+            # Nobody sees the colors when output is piped to a file or CI log (or
+            # when asked to be quiet), so skip building the rich trees entirely.
+            if not console.is_terminal or os.environ.get("SHULKER_QUIET"):
+                self.print_plain_errors(errors)
+                return True
+
             messages: list[RenderableType] = [
                 Text(f"❌ {self.format_error_summary(errors)}", style="red"),
                 "",
@@ -842,7 +1114,7 @@ class ItemType(type):
                             )
                         if source_info := self._component_sources.get(name):
                             msg_parts.append(
-                                f"  [dim]Defined in:[/dim] [bold green]{source_info['class']}[/bold green] ([italic green]{source_info['module']}[/italic green])"
+                                f"  [dim]Defined in:[/dim] [bold green]{source_info.class_name}[/bold green] ([italic green]{source_info.module}[/italic green])"
                             )
                         messages.append("\n".join(msg_parts))
                     case ComponentError(
@@ -855,24 +1127,22 @@ class ItemType(type):
                         header_parts = [f"Component [x]{name!r}[/x] failed validation"]
                         if source_info:
                             header_parts.append(
-                                f"[dim]Defined in:[/dim] [bold green]{source_info['class']}[/bold green] ([italic green]{source_info['module']}[/italic green])"
+                                f"[dim]Defined in:[/dim] [bold green]{source_info.class_name}[/bold green] ([italic green]{source_info.module}[/italic green])"
                             )
                         if hint:
                             header_parts.append(f"[yellow]💡 {hint}[/yellow]")
 
+                        # plain text rather than `Syntax`, which runs pygments over
+                        # every dumped component before anything gets printed
                         tree = Tree(
                             Group(
                                 *header_parts,
-                                Syntax(
-                                    json.dumps(component, indent=2, cls=ItemTypeEncoder),
-                                    "python",
-                                    theme="material",
-                                ),
+                                Text(_dump_component(component), style="body"),
                             ),
                             guide_style="red",
                         )
 
-                        handle_suberrors(tree, suberrors)
+                        _render_suberrors(tree, suberrors)
                         messages.append(tree)
 
             title = f"Item [x]{self.name!r}[/x] failed component validation"
@@ -891,10 +1161,33 @@ class ItemType(type):
             return True
         return False
 
+    def print_plain_errors(self, errors: list[ComponentError]):
+        """Print component errors as plain text, one line per component and suberror"""
+        print(f"Item {self.name!r} failed component validation ({self.__module__})")
+        for error in errors:
+            source_info = error.source_info or self._component_sources.get(error.name)
+            source = (
+                f" [defined in {source_info.class_name} ({source_info.module})]"
+                if source_info
+                else ""
+            )
+            match error:
+                case NonExistentComponentError(name=name, suggestions=suggestions):
+                    did_you_mean = (
+                        f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+                    )
+                    print(f"  ❌ Component {name!r} does not exist!{did_you_mean}{source}")
+                case ComponentError(name=name, suberrors=suberrors, hint=hint):
+                    print(f"  ❌ Component {name!r} failed validation{source}")
+                    if hint:
+                        print(f"    💡 {hint}")
+                    for line in _plain_suberrors(suberrors):
+                        print(line)
+
     @property
     def name(self) -> str:
         """Get the item's snake_case name from its class name."""
-        return camel_case_to_snake_case(self.__name__)
+        return self._name
 
     @property
     def has_id(self) -> bool:
@@ -972,12 +1265,22 @@ class ItemType(type):
         Raises:
             ItemError: If item doesn't have an ID defined
         """
+        # components are resolved once and never change, so neither does the string
+        if self._item_string is not None:
+            return self._item_string
+
         components = []
         for k, v in self.components.items():
             if v is Remove:
                 components.append(f"!{k}")
             elif isinstance(v, ItemType):
                 components.append(f"{k}={v.name}")
+            elif type(v) in _NBT_SCALARS:
+                # scalar components (rarity, max_stack_size, ...) repeat across items
+                key = (k, type(v), v)
+                if (part := _scalar_component_strings.get(key)) is None:
+                    part = _scalar_component_strings[key] = f"{k}={nbt_dump(v)}"
+                components.append(part)
             else:
                 components.append(f"{k}={nbt_dump(v)}")
 
@@ -987,7 +1290,9 @@ class ItemType(type):
             raise ItemError(
                 f"`{self.name}` item must define an `id` if generating a give or other command!"
             )
-        return f"{self.id}[{final_components}]"
+
+        self._item_string = f"{self.id}[{final_components}]"
+        return self._item_string
 
     def conditional_string(self) -> str:
         """Generate a Minecraft item predicate string for conditional checks.
@@ -997,7 +1302,11 @@ class ItemType(type):
         Returns:
             String like "*[custom_data~{item:'dart'}]"
         """
-        return f"*[custom_data~{nbt_dump(self.conditional_data)}]"
+        if self._conditional_string is None:
+            self._conditional_string = (
+                f"*[custom_data~{nbt_dump(self.conditional_data)}]"
+            )
+        return self._conditional_string
 
     def conditional_dict(self) -> dict[str, Any]:
         """Generate an item predicate dictionary for conditional checks."""
@@ -1005,7 +1314,11 @@ class ItemType(type):
 
     def exact_conditional_string(self) -> str:
         """Generate an item predicate string for matching only this item."""
-        return f"*[custom_data~{nbt_dump(self.exact_conditional_data)}]"
+        if self._exact_conditional_string is None:
+            self._exact_conditional_string = (
+                f"*[custom_data~{nbt_dump(self.exact_conditional_data)}]"
+            )
+        return self._exact_conditional_string
 
     def exact_conditional_dict(self) -> dict[str, Any]:
         """Generate an item predicate dictionary for matching only this item."""
@@ -1014,16 +1327,20 @@ class ItemType(type):
     def as_dict(self) -> dict[str, Any]:
         """Convert item to a dictionary suitable for NBT serialization."""
         # we need to convert `Remove` to negative components for use in storage / give commands, etc
-        components = {}
-        for k, v in self.components.items():
-            if v is Remove:
-                components[f"!{k}"] = {}
-            elif isinstance(v, ItemType):
-                components[k] = v.name
-            else:
-                components[k] = v
+        if self._dict_components is None:
+            components = {}
+            for k, v in self.components.items():
+                if v is Remove:
+                    components[f"!{k}"] = {}
+                elif isinstance(v, ItemType):
+                    components[k] = v.name
+                else:
+                    components[k] = v
+
+            self._dict_components = components
 
-        return {"id": self.id, "count": 1, "components": components}
+        # callers (e.g. ItemStack) patch the result, so hand out a fresh top level
+        return {"id": self.id, "count": 1, "components": dict(self._dict_components)}
 
     def as_loot_table(self) -> dict[str, Any]:
         """Converts item into a loot table. Useful for adding item modifiers"""
@@ -1050,7 +1367,7 @@ class ItemType(type):
     __neg__ = __invert__ = conditional_string
     __pos__ = __str__ = item_string
 
-    def debug(self):
+    def debug(self, color: bool = False):
         """Display comprehensive debugging information about this item's construction.
 
         Shows:
@@ -1061,23 +1378,33 @@ class ItemType(type):
 
         Usage:
             MyItem.debug()  # Print debug info to console
+            MyItem.debug(color=True)  # Syntax highlight the component dumps (slower)
 
         This is helpful when:
         - Debugging component validation errors
         - Understanding how custom components transform
         - Verifying final component values
         """
+        from lib.rich import console, Syntax, Group, Panel, Text
+
+        def dump(mapping: dict[str, Any]) -> RenderableType:
+            # plain text skips pygments lexing, which dominates on large components
+            if not color:
+                return Text(json.dumps(mapping, indent=2, default=repr))
+
+            import pprint
+
+            return Syntax(pprint.pformat(mapping), "python", theme="material")
+
         # Collect custom components/transformers that apply to this item
         item_attrs = {k for k in self.__dict__.keys() if not k.startswith("_")}
         applied_components = [
             f"  • {comp.name()} → {comp.__name__}"
-            for comp in Component.registered
-            if comp.name() in item_attrs
+            for comp in Component.registered_for(item_attrs)
         ]
         applied_transformers = [
             f"  • {trans.name()} (transformer) → {trans.__name__}"
-            for trans in Transformer.registered
-            if trans.name() in item_attrs
+            for trans in Transformer.registered_for(item_attrs)
         ]
         applied_global_transformers = [
             f"  • {trans.name()} (global transformer) → {trans.__name__}"
@@ -1091,16 +1418,12 @@ class ItemType(type):
             Text(f"ID: {self.id if self.has_id else '[not set]'}", style="dim"),
             "",
             Text("Original attributes:", style="bold"),
-            Syntax(
-                pprint.pformat(
-                    {
-                        k: v
-                        for k, v in self.__dict__.items()
-                        if not k.startswith("_") and not callable(v)
-                    }
-                ),
-                "python",
-                theme="material",
+            dump(
+                {
+                    k: v
+                    for k, v in self.__dict__.items()
+                    if not k.startswith("_") and not callable(v)
+                }
             ),
         ]
 
@@ -1124,11 +1447,7 @@ class ItemType(type):
             [
                 "",
                 Text("Final components:", style="bold"),
-                Syntax(
-                    pprint.pformat(self.components),
-                    "python",
-                    theme="material",
-                ),
+                dump(self.components),
             ]
         )
 
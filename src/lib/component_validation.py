@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from methodtools import lru_cache
+from collections.abc import Callable
+from dataclasses import dataclass, field
 import json
 from typing import Any, ClassVar
 import logging
@@ -8,7 +8,6 @@ from beet import Context
 
 from plugins.component_caching import (
     BooleanLiteralValue,
-    ByteLiteralValue,
     ByteSchema,
     DynamicIndex,
     IntLiteralValue,
@@ -31,6 +30,8 @@ from plugins.component_caching import (
     StructSchema,
     EnumSchema,
     DispatcherSchema,
+    ValueRange,
+    build_schema,
 )
 from lib.errors import (
     DispatcherNotFound,
@@ -43,9 +44,11 @@ logger = logging.getLogger(__name__)
 
 
 SchemaFile = dict[str, Schema]
-
-
-cache = lru_cache(maxsize=None)
+# stands in for anything that failed to resolve, doesn't validate anything
+DUMMY_SCHEMA = Schema.model_construct(None)
+# validates `data` at `path` (with `parent` holding it), raising on failure.
+# `path` is shared and mutated in place while descending, copy it to keep it
+Validator = Callable[[Json, list[str | int], Json | None], None]
 
 
 @dataclass
@@ -54,42 +57,69 @@ class McdocValidator:
 
     mcdoc: ClassVar[dict[str, Any]]
 
+    # parsed schemas by mcdoc path, the set of paths is finite so these never evict
+    _schemas: dict[str, Schema] = field(default_factory=dict, init=False, repr=False)
+    _dispatchers: dict[str, dict[str, Schema]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # compiled validators keyed by schema id, see `compile`
+    _compiled: dict[int, tuple[Schema, Validator]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # compiled leaf validators keyed by the leaf's json, see `compile`
+    _interned: dict[str, Validator] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def __post_init__(self):
         self.mcdoc = self.ctx.meta["mcdoc"]
 
-    @cache
+        # validated once up front, references then only ever do a dict lookup
+        for path, data in self.mcdoc["mcdoc"].items():
+            try:
+                self._schemas[path] = build_schema(data)
+            except Exception as err:
+                # TODO: clean up
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s", json.dumps(data))
+                    logger.debug(err)
+                self._schemas[path] = DUMMY_SCHEMA
+
     def get_mcdoc_schema(self, path: str) -> Schema:
         """
         Resolves a schema reference path within the mcdoc document.
-        Assumes mcdoc contains either raw dict representations of schemas or parsed Schema objects.
+        Unknown paths resolve to a dummy schema that doesn't validate anything.
         """
 
-        try:
-            return Schema.model_validate(data := self.mcdoc["mcdoc"][path])
-        except Exception as err:
-            # TODO: clean up
-            logger.debug(json.dumps(data))
-            logger.debug(err)
+        if (schema := self._schemas.get(path)) is None:
+            logger.debug("Unknown mcdoc path %s", path)
+            schema = self._schemas[path] = DUMMY_SCHEMA
 
-        return Schema.model_construct(None)  # dummy schema, no validation
+        return schema
 
-    @cache
     def get_dispatcher_schema(self, path: str) -> dict[str, Schema]:
         """
         Resolves a schema reference path within the mcdoc document.
         Assumes mcdoc contains either raw dict representations of schemas or parsed Schema objects.
         """
 
+        if (registry := self._dispatchers.get(path)) is not None:
+            return registry
+
+        data = None
         try:
             data = self.mcdoc["mcdoc/dispatcher"][path]
-            return {key: Schema.model_validate(value) for key, value in data.items()}
+            registry = {key: build_schema(value) for key, value in data.items()}
 
         except Exception as err:
             # TODO: clean up
-            logger.debug(json.dumps(data))
-            logger.debug(err)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s", json.dumps(data))
+                logger.debug(err)
+            registry = DUMMY_SCHEMA
 
-        return Schema.model_construct(None)  # dummy schema, no validation
+        self._dispatchers[path] = registry
+        return registry
 
     def validate_data(
         self,
@@ -102,352 +132,723 @@ class McdocValidator:
         Validates a given JSON-like data structure against a specified schema,
         raising exceptions on failure.
 
+        The schema is compiled into a validator on first use (see `compile`), so
+        repeated validations against the same schema skip re-interpreting it.
+
         Args:
             data: The JSON-like data to validate.
             schema: The schema definition to validate against. This is expected to be
                     an instance of the Schema (RootModel) class.
-            mcdoc: A dictionary containing referenced schema definitions.
-                These definitions can be raw dictionaries or already parsed Schema objects.
             path: Internal list to track the current data path for error reporting.
+                  Validators push and pop keys on it as they descend, so it is left as
+                  it was passed in once validation returns or raises.
+            parent: The object containing `data`, used by dispatchers with dynamic indices.
 
         Raises:
             ValidationError: If the data does not conform to the schema.
             ExceptionGroup: If multiple validation errors occur (e.g., in UnionSchema or ListSchema).
             ValueError: For issues within the schema definition itself (e.g., multiple SpreadFields).
         """
+        if schema.root is not None:
+            self.compile(schema)(data, path, parent)
+
+    def compile(self, schema: Schema) -> Validator:
+        """Compiles a schema into a validator closure, memoized per schema object.
+
+        Compiled validators hold on to the already compiled validators of their children,
+        so validating data doesn't re-dispatch on the kind of every schema node it visits.
+        Recursive schemas compile against a forwarding stub while they're being built.
+        """
+        if (entry := self._compiled.get(id(schema))) is not None and entry[0] is schema:
+            return entry[1]
 
-        match schema.root:
-            case ReferenceSchema(path=ref_path):
-                resolved_schema = self.get_mcdoc_schema(ref_path)
-                self.validate_data(data, resolved_schema, path)
+        if type(schema.root) in _LEAF_SCHEMAS:
+            # leaves repeat a lot (plain ints, strings, ...), share one validator each
+            key = schema.root.model_dump_json(exclude={"attributes"})
+            if (validator := self._interned.get(key)) is None:
+                validator = self._interned[key] = self._compile(schema.root)
+            self._compiled[id(schema)] = (schema, validator)
+            return validator
 
-            case UnionSchema(members=members):
-                errors = []
-                for i, member_schema in enumerate(members):
+        validator: Validator | None = None
+
+        def forward(data: Json, path: list[str | int], parent: Json | None):
+            validator(data, path, parent)
+
+        # keep the schema alive alongside its validator so its id can't be reused
+        self._compiled[id(schema)] = (schema, forward)
+        try:
+            validator = self._compile(schema.root)
+        except Exception:
+            del self._compiled[id(schema)]
+            raise
+        self._compiled[id(schema)] = (schema, validator)
+        return validator
+
+    def _compile(self, root: Any) -> Validator:
+        match root:
+            case ReferenceSchema():
+                return self._compile_reference(root)
+            case UnionSchema():
+                return self._compile_union(root)
+            case ListSchema():
+                return self._compile_list(root)
+            case IntArraySchema():
+                return self._compile_array(
+                    root, frozenset({int}), "int", "list[int]", "array[int]"
+                )
+            case FloatArraySchema():
+                # ints (and bools) are fine wherever a float is expected, like `FloatSchema`
+                return self._compile_array(
+                    root, _FLOAT_TYPES, "float", "list[float]", "list[float]"
+                )
+            case StringSchema():
+                return self._compile_string(root)
+            case IntSchema():
+                return self._compile_int(root)
+            case FloatSchema():
+                return self._compile_float(root)
+            case BooleanSchema():
+                return self._compile_boolean(root)
+            case ByteSchema():
+                return self._compile_byte(root)
+            case LiteralSchema():
+                return self._compile_literal(root)
+            case StructSchema():
+                return self._compile_struct(root)
+            case EnumSchema():
+                return self._compile_enum(root)
+            case DispatcherSchema():
+                return self._compile_dispatcher(root)
+
+        # dummy schema, no validation
+        return _accept
+
+    def _compile_reference(self, root: ReferenceSchema) -> Validator:
+        # follow the whole chain now so references cost nothing when validating
+        return self.compile(self._resolve(Schema.model_construct(root)))
+
+    def _resolve(self, schema: Schema) -> Schema:
+        """Follows a chain of references to the schema it ends at.
+
+        A chain that only loops through references resolves to a dummy schema.
+        """
+
+        seen: set[str] = set()
+        while isinstance(schema.root, ReferenceSchema):
+            if schema.root.path in seen:
+                # only references all the way around, nothing to validate against
+                return DUMMY_SCHEMA
+            seen.add(schema.root.path)
+            schema = self.get_mcdoc_schema(schema.root.path)
+
+        return schema
+
+    def _needs_parent(self, schema: Schema) -> bool:
+        """Whether validating against `schema` reads the parent.
+
+        Only dispatchers with a dynamic index (possibly behind references) do, everything
+        else is handed None so containers don't pass themselves down to every child.
+        """
+
+        seen: set[str] = set()
+        pending = [schema.root]
+        while pending:
+            match pending.pop():
+                case DispatcherSchema(parallel_indices=indices):
+                    if any(isinstance(index, DynamicIndex) for index in indices):
+                        return True
+                case ReferenceSchema(path=ref_path) if ref_path not in seen:
+                    seen.add(ref_path)
+                    pending.append(self.get_mcdoc_schema(ref_path).root)
+
+        return False
+
+    def _compile_union(self, root: UnionSchema) -> Validator:
+        members = [
+            (self.compile(member_schema), member_schema.root is not None)
+            for member_schema in root.members
+        ]
+        # members bucketed by the data types they can accept, so members that can't
+        # match are skipped without raising. Literals keep an extra equality check
+        candidates: dict[type, list[tuple[Validator, Callable[[Json], bool] | None]]]
+        candidates = {json_type: [] for json_type in _JSON_TYPES}
+        unknown_candidates = []
+        for member_schema in root.members:
+            if member_schema.root is None:
+                continue
+
+            member_root = self._resolve(member_schema).root
+            candidate = (self.compile(member_schema), _literal_check(member_root))
+            shape = _shape(member_root, self._resolve)
+            for json_type, bucket in candidates.items():
+                if shape is None or json_type in shape:
+                    bucket.append(candidate)
+            if shape is None:
+                unknown_candidates.append(candidate)
+
+        def validate_members(data: Json, path: list[str | int], parent: Json | None):
+            for member_validator, check in candidates.get(
+                type(data), unknown_candidates
+            ):
+                if check is None or check(data):
                     try:
-                        self.validate_data(data, member_schema, path)
-                        if member_schema.root is not None:
-                            return  # If any member validates, the union is valid
-                    except (ValidationError, ExceptionGroup) as e:
-                        errors.append(e)
-                if errors:
+                        member_validator(data, path, None)
+                        return  # If any member validates, the union is valid
+                    except (ValidationError, ExceptionGroup):
+                        pass
+
+            # nothing matched, go through every member again to collect the errors
+            errors = []
+            for member_validator, is_real in members:
+                try:
+                    member_validator(data, path, None)
+                    if is_real:
+                        return
+                except (ValidationError, ExceptionGroup) as e:
+                    errors.append(e)
+            if errors:
+                raise ValidationError(
+                    path[-1] if path else "unknown",
+                    data,
+                    "union",
+                    errors,
+                    f"Data failed to validate against any of the {len(members)} union members",
+                )
+            else:
+                # This case should ideally not be hit if members list is not empty
+                raise MissingValidationError(path[-1], None, "union")
+
+        if (discriminated := self._discriminate_union(root)) is None:
+            return validate_members
+
+        discriminator, table = discriminated
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if type(data) is dict and isinstance(
+                tag := data.get(discriminator), (str, int)
+            ):
+                if (member_validator := table.get(tag)) is not None:
+                    return member_validator(data, path, None)
+            validate_members(data, path, parent)
+
+        return validate
+
+    def _discriminate_union(
+        self, root: UnionSchema
+    ) -> tuple[str, dict[Any, Validator]] | None:
+        """Finds a required literal field that tells the struct members of a union apart.
+
+        Returns the field name and a table from its literal value to the member validator,
+        or None when some member isn't a struct or no such field exists.
+        """
+
+        tagged: list[tuple[Schema, dict[str, Any]]] = []
+        for member_schema in root.members:
+            match member_schema.root:
+                case None:
+                    # dummy members never make a union valid, so they can't be picked
+                    continue
+                case StructSchema(fields=fields):
+                    tagged.append(
+                        (
+                            member_schema,
+                            {
+                                field.key: field.type.root.value.value
+                                for field in fields
+                                if isinstance(field, PairField)
+                                and isinstance(field.key, str)
+                                and not field.optional
+                                and isinstance(field.type.root, LiteralSchema)
+                            },
+                        )
+                    )
+                case _:
+                    return None
+
+        if len(tagged) < 2:
+            return None
+
+        common = set(tagged[0][1]).intersection(*(tags for _, tags in tagged[1:]))
+        for discriminator in sorted(common):
+            table = {
+                tags[discriminator]: self.compile(member_schema)
+                for member_schema, tags in tagged
+            }
+            if len(table) == len(tagged):
+                return discriminator, table
+
+        return None
+
+    def _compile_list(self, root: ListSchema) -> Validator:
+        item_validator = self.compile(root.item)
+        item_needs_parent = self._needs_parent(root.item)
+        check_length = _compile_length_check(root.length_range, "list")
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if type(data) is not list:
+                raise ValidationError(path[-1], data, "list")
+
+            if check_length is not None:
+                check_length(data, path)
+
+            # only allocated once something fails, most lists are valid
+            item_errors = None
+            for i, item in enumerate(data):
+                path.append(i)
+                try:
+                    item_validator(item, path, data if item_needs_parent else None)
+                except (ValidationError, ExceptionGroup) as e:
+                    if item_errors is None:
+                        item_errors = []
+                    item_errors.append(e)
+                finally:
+                    path.pop()
+            if item_errors:
+                raise ValidationError(
+                    path[-1],
+                    data,
+                    "list",
+                    item_errors,
+                    "Multiple items in list failed validation",
+                )
+
+        return validate
+
+    def _compile_array(
+        self,
+        root: IntArraySchema | FloatArraySchema,
+        item_types: frozenset[type],
+        item_name: str,
+        expected: str,
+        error_expected: str,
+    ) -> Validator:
+        check_length = _compile_length_check(root.length_range, expected)
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if type(data) is not list:
+                raise ValidationError(path[-1], data, "list")
+
+            if check_length is not None:
+                check_length(data, path)
+
+            # scan once, only look for the offending items when something is off
+            if not all(type(item) in item_types for item in data):
+                raise ValidationError(
+                    path[-1],
+                    data,
+                    error_expected,
+                    [
+                        ValidationError(i, data, item_name)
+                        for i, item in enumerate(data)
+                        if type(item) not in item_types
+                    ],
+                    "Multiple items in list failed validation",
+                )
+
+        return validate
+
+    def _compile_string(self, root: StringSchema) -> Validator:
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if type(data) is not str:
+                raise ValidationError(path[-1], data, "str")
+
+        return validate
+
+    def _compile_int(self, root: IntSchema) -> Validator:
+        value_range = root.value_range
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            # exact type checks, json never has subclasses and bools aren't ints here
+            if type(data) is not int:
+                raise ValidationError(path[-1], data, "int")
+
+            if value_range:
+                if value_range.min is not None and data < value_range.min:
                     raise ValidationError(
-                        path[-1] if path else "unknown",
+                        path[-1],
                         data,
-                        "union",
-                        errors,
-                        f"Data failed to validate against any of the {len(members)} union members",
+                        "int",
+                        msg=f"Int {data} is less than minimum allowed {value_range.min}",
                     )
-                else:
-                    # This case should ideally not be hit if members list is not empty
-                    raise MissingValidationError(path[-1], None, "union")
-
-            case ListSchema(item=item_schema, length_range=length_range):
-                if not isinstance(data, list):
-                    raise ValidationError(path[-1], data, "list")
-
-                if length_range is not None:
-                    length = len(data)
-                    if length_range.min is not None and length < length_range.min:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "list",
-                            msg=f"List length {length} is less than minimum required {length_range.min}",
-                        )
-                    if length_range.max is not None and length > length_range.max:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "list",
-                            msg=f"List length {length} is greater than maximum allowed {length_range.min}",
-                        )
-
-                item_errors = []
-                for i, item in enumerate(data):
-                    try:
-                        self.validate_data(item, item_schema, path + [i], data)
-                    except (ValidationError, ExceptionGroup) as e:
-                        item_errors.append(e)
-                if item_errors:
+                if value_range.max is not None and data > value_range.max:
                     raise ValidationError(
                         path[-1],
                         data,
-                        "list",
-                        item_errors,
-                        "Multiple items in list failed validation",
+                        "int",
+                        msg=f"Int {data} is greater than maxinum allowed {value_range.max}",
                     )
 
-            case IntArraySchema(length_range=length_range):
-                if not isinstance(data, list):
-                    raise ValidationError(path[-1], data, "list")
+        return validate
 
-                if length_range is not None:
-                    length = len(data)
-                    if length_range.min is not None and length < length_range.min:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "list[int]",
-                            msg=f"List length {length} is less than minimum required {length_range.min}",
-                        )
-                    if length_range.max is not None and length > length_range.max:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "list[int]",
-                            msg=f"List length {length} is greater than maximum allowed {length_range.min}",
-                        )
+    def _compile_float(self, root: FloatSchema) -> Validator:
+        value_range = root.value_range
 
-                item_errors = []
-                for i, item in enumerate(data):
-                    try:
-                        if isinstance(item) is not int:
-                            raise ValidationError(i, data, "int")
-                    except (ValidationError, ExceptionGroup) as e:
-                        item_errors.append(e)
-                if item_errors:
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            # Allow integers for float schema as they can be represented as floats. Only
+            # `IntSchema` rejects bools, here they're still accepted like `isinstance` did
+            if type(data) not in _FLOAT_TYPES:
+                raise ValidationError(path[-1], data, "float")
+
+            if value_range:
+                if value_range.min is not None and data < value_range.min:
                     raise ValidationError(
                         path[-1],
                         data,
-                        "array[int]",
-                        item_errors,
-                        "Multiple items in list failed validation",
+                        "float",
+                        msg=f"Number {data} is less than minimum allowed {value_range.min}",
                     )
-
-            case FloatArraySchema(length_range=length_range):
-                if not isinstance(data, list):
-                    raise ValidationError(path[-1], data, "list")
-
-                if length_range is not None:
-                    length = len(data)
-                    if length_range.min is not None and length < length_range.min:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "list[float]",
-                            msg=f"List length {length} is less than minimum required {length_range.min}",
-                        )
-                    if length_range.max is not None and length > length_range.max:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "list[float]",
-                            msg=f"List length {length} is greater than maximum allowed {length_range.min}",
-                        )
-
-                item_errors = []
-                for i, item in enumerate(data):
-                    try:
-                        if isinstance(item) is not float:
-                            raise ValidationError(i, data, "float")
-                    except (ValidationError, ExceptionGroup) as e:
-                        item_errors.append(e)
-                if item_errors:
+                if value_range.max is not None and data > value_range.max:
                     raise ValidationError(
                         path[-1],
                         data,
-                        "list[float]",
-                        item_errors,
-                        "Multiple items in list failed validation",
+                        "float",
+                        msg=f"Number {data} is greater than maxinum allowed {value_range.max}",
                     )
 
-            case StringSchema():
-                if not isinstance(data, str):
-                    raise ValidationError(path[-1], data, "str")
+        return validate
 
-            case IntSchema(value_range=value_range):
-                if not isinstance(data, int):
-                    raise ValidationError(path[-1], data, "int")
+    def _compile_boolean(self, root: BooleanSchema) -> Validator:
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if type(data) is not bool:
+                raise ValidationError(path[-1], data, "bool")
 
-                if value_range:
-                    if value_range.min is not None and data < value_range.min:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "int",
-                            msg=f"Int {data} is less than minimum allowed {value_range.min}",
-                        )
-                    if value_range.max is not None and data > value_range.max:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "int",
-                            msg=f"Int {data} is greater than maxinum allowed {value_range.max}",
-                        )
+        return validate
 
-            case FloatSchema(value_range=value_range):
-                # Allow integers for float schema as they can be represented as floats
-                if not isinstance(data, (int, float)):
-                    raise ValidationError(path[-1], data, "float")
+    def _compile_byte(self, root: ByteSchema) -> Validator:
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if (data_type := type(data)) is not int and data_type is not bool:
+                raise ValidationError(path[-1], data, "byte")
 
-                if value_range:
-                    if value_range.min is not None and data < value_range.min:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "float",
-                            msg=f"Number {data} is less than minimum allowed {value_range.min}",
-                        )
-                    if value_range.max is not None and data > value_range.max:
-                        raise ValidationError(
-                            path[-1],
-                            data,
-                            "float",
-                            msg=f"Number {data} is greater than maxinum allowed {value_range.max}",
-                        )
+        return validate
 
-            case BooleanSchema():
-                if not isinstance(data, bool):
-                    raise ValidationError(path[-1], data, "bool")
+    def _compile_literal(self, root: LiteralSchema) -> Validator:
+        value = root.value.value
 
-            case ByteSchema():
-                if not isinstance(data, (int, bool)):
-                    raise ValidationError(path[-1], data, "byte")
-
-            case LiteralSchema(value=literal):
-                match literal:
-                    case IntLiteralValue(value=value):
-                        ...
-                    case BooleanLiteralValue(value=value):
-                        ...
-                    case StringLiteralValue(value=value):
-                        ...
-                    case ByteLiteralValue(value=value):
-                        ...
-
-                if data != value:
+        if isinstance(root.value, BooleanLiteralValue):
+
+            def validate(data: Json, path: list[str | int], parent: Json | None):
+                # `1 == True`, so also check the type like `BooleanSchema` does
+                if data != value or type(data) is not bool:
                     raise ValidationError(path[-1], data, value)
 
-            case StructSchema(fields=fields):
-                if not isinstance(data, dict):
-                    raise ValidationError(path[-1], data, "dict")
-
-                remaining_keys = set(data.keys())
-                spread_schema: Schema | None = None
-                has_spread_field = False
-                struct_errors = []
-
-                for field in fields:
-                    match field:
-                        case PairField(
-                            key=field_key, type=field_type, optional=optional
-                        ):
-                            if isinstance(field_key, Schema):
-                                # TODO WEE WOO
-                                logging.debug(
-                                    f"Warning. Unsure what to do /shrug. Likely enchantment registry {field_key}\n{data}"
-                                )
-                                remaining_keys = set()
-                                continue
-
-                            if field_key in data:
-                                try:
-                                    remaining_keys.discard(field_key)
-                                    self.validate_data(
-                                        data[field_key],
-                                        field_type,
-                                        path + [field_key],
-                                        data,
-                                    )
-                                except (ValidationError, ExceptionGroup) as e:
-                                    struct_errors.append(e)
-                            elif not optional:
-                                struct_errors.append(
-                                    MissingValidationError(field_key, field, "dict")
-                                )
-                        case SpreadField(type=spread_type):
-                            if has_spread_field:
-                                # This is a schema definition error, not a data validation error.
-                                raise ValueError(
-                                    f"StructSchema at '{'.'.join(map(str, path))}' contains multiple SpreadFields, which is ambiguous."
-                                )
-                            spread_schema = spread_type
-                            has_spread_field = True
-
-                if remaining_keys:
-                    if spread_schema:
+            return validate
+
+        # strings compare exactly anyway, int and byte literals take booleans as before
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if data != value:
+                raise ValidationError(path[-1], data, value)
+
+        return validate
+
+    def _compile_struct(self, root: StructSchema) -> Validator:
+        # field key -> ([(validator, needs parent)], bit), so each data key is a single
+        # lookup. A key declared more than once is checked against every declaration.
+        # Required keys get their own bit, optional ones 0, and seen bits are or'ed
+        pair_map: dict[str, tuple[list[tuple[Validator, bool]], int]] = {}
+        required: list[tuple[int, str, PairField]] = []
+        required_mask = 0
+        schema_keys: list[Schema] = []
+        spread_validator: Validator | None = None
+
+        for field in root.fields:
+            match field:
+                case PairField(key=field_key, type=field_type, optional=optional):
+                    if isinstance(field_key, Schema):
+                        schema_keys.append(field_key)
+                        continue
+
+                    validators, bit = pair_map.get(field_key, ([], 0))
+                    validators.append(
+                        (self.compile(field_type), self._needs_parent(field_type))
+                    )
+                    if not optional:
+                        if not bit:
+                            bit = 1 << required_mask.bit_length()
+                            required_mask |= bit
+                        required.append((bit, field_key, field))
+                    pair_map[field_key] = (validators, bit)
+                case SpreadField(type=spread_type):
+                    if spread_validator is not None:
+                        # This is a schema definition error, not a data validation error.
+                        raise ValueError(
+                            "StructSchema contains multiple SpreadFields, which is ambiguous."
+                        )
+                    spread_validator = self.compile(spread_type)
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if type(data) is not dict:
+                raise ValidationError(path[-1], data, "dict")
+
+            # only allocated once needed, most structs are valid and fully declared
+            struct_errors = None
+            remaining_keys = None
+            seen = 0
+
+            for key, value in data.items():
+                if (hit := pair_map.get(key)) is None:
+                    if remaining_keys is None:
+                        remaining_keys = []
+                    remaining_keys.append(key)
+                    continue
+
+                field_validators, bit = hit
+                seen |= bit
+                path.append(key)
+                try:
+                    for field_validator, needs_parent in field_validators:
                         try:
-                            self.validate_data(
-                                {key: data[key] for key in remaining_keys},
-                                spread_schema,
-                                path,
-                                data,
+                            field_validator(
+                                value, path, data if needs_parent else None
                             )
                         except (ValidationError, ExceptionGroup) as e:
+                            if struct_errors is None:
+                                struct_errors = []
                             struct_errors.append(e)
-                    else:
-                        for key in remaining_keys:
-                            struct_errors.append(
-                                UnexpectedValidationError(key, data[key])
-                            )
+                finally:
+                    path.pop()
 
-                if struct_errors:
-                    raise ValidationError(
-                        path[-1],
-                        data,
-                        "dict",
-                        struct_errors,
-                        "Multiple errors in struct validation",
-                    )
+            if (missing := required_mask & ~seen) or remaining_keys:
+                struct_errors = struct_errors or []
 
-            case EnumSchema(enum_kind=enum_kind, values=values):
-                match enum_kind:
-                    case "string":
-                        if not isinstance(data, str):
-                            raise ValidationError(path[-1], data, "str")
-
-                    case "int" | "short" | "long" as typ:
-                        if not isinstance(data, int):
-                            raise ValidationError(path[-1], data, typ)
-                    case "bytes":
-                        if not isinstance(data, (bool, int)):
-                            raise ValidationError(path[-1], data, "bytes")
-                    case "float" | "double" as typ:
-                        if not isinstance(data, (int, float)):
-                            raise ValidationError(path[-1], data, typ)
-
-                if data not in (enum_identifiers := {value.value for value in values}):
-                    raise ValidationError(path[-1], data, f"enum {enum_identifiers}")
-
-            case DispatcherSchema(
-                parallel_indices=parallel_indices, registry=registry_path
-            ):
-                if not isinstance(data, (list, dict)):
-                    raise ValidationError(path[-1], data, "dispatcher (list|dict)")
+            if missing:
+                for bit, field_key, field in required:
+                    if missing & bit:
+                        struct_errors.append(
+                            MissingValidationError(field_key, field, "dict")
+                        )
 
-                if (registry := self.get_dispatcher_schema(registry_path)) is None:
-                    raise ValidationError(registry_path, None, "registry not found")
+            # TODO WEE WOO
+            if schema_keys:
+                logging.debug(
+                    f"Warning. Unsure what to do /shrug. Likely enchantment registry {schema_keys[0]}\n{data}"
+                )
+                remaining_keys = None
 
-                union_types = []
-                for index in parallel_indices:
-                    match index:
-                        case DynamicIndex(accessor=accessors):
-                            union_types.extend(
-                                (parent[accessor], accessor)
-                                for accessor in accessors
-                                if type(accessor) is str
-                            )
-                        case StaticIndex(value=value):
-                            union_types.append((value, None))
-                
-                fallback = False
-                for typ, accessor in union_types:
-                    found_schema = registry.get(typ)
-                    if found_schema is None:
-                        found_schema = registry.get(typ.replace("minecraft:", ""))
-                    
-                    if found_schema:
-                        self.validate_data(
-                            {k: v for k, v in data.items() if k != accessor},
-                            found_schema,
+            if remaining_keys:
+                if spread_validator is not None:
+                    try:
+                        spread_validator(
+                            {key: data[key] for key in remaining_keys},
                             path,
                             data,
                         )
-                        break
-
-                    if typ.startswith("%"):
-                        fallback = True
+                    except (ValidationError, ExceptionGroup) as e:
+                        struct_errors.append(e)
                 else:
-                    if not fallback:
-                        raise DispatcherNotFound(f"Dispatcher not found for {data}: registry {registry}", data)
+                    for key in remaining_keys:
+                        struct_errors.append(UnexpectedValidationError(key, data[key]))
+
+            if struct_errors:
+                raise ValidationError(
+                    path[-1],
+                    data,
+                    "dict",
+                    struct_errors,
+                    "Multiple errors in struct validation",
+                )
+
+        return validate
+
+    def _compile_enum(self, root: EnumSchema) -> Validator:
+        match root.enum_kind:
+            case "string":
+                kind_types, kind_name = frozenset({str}), "str"
+            # numeric enums accept bools, as only `IntSchema` rejects them
+            case "byte" | "int" | "short" | "long" as typ:
+                kind_types, kind_name = _INT_TYPES, typ
+            case "float" | "double" as typ:
+                kind_types, kind_name = _FLOAT_TYPES, typ
+            case _:
+                kind_types, kind_name = None, None
+
+        enum_identifiers = frozenset(value.value for value in root.values)
+        expected = f"enum {set(enum_identifiers)}"
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            if kind_types is not None and type(data) not in kind_types:
+                raise ValidationError(path[-1], data, kind_name)
+
+            if data not in enum_identifiers:
+                raise ValidationError(path[-1], data, expected)
+
+        return validate
+
+    def _compile_dispatcher(self, root: DispatcherSchema) -> Validator:
+        registry_path = root.registry
+        # (static type, None) or (None, dynamic accessor), in index order
+        indices: list[tuple[str | None, str | None]] = []
+        for index in root.parallel_indices:
+            match index:
+                case DynamicIndex(accessor=accessors):
+                    indices.extend(
+                        (None, accessor)
+                        for accessor in accessors
+                        if type(accessor) is str
+                    )
+                case StaticIndex(value=value):
+                    indices.append((value, None))
+        static_fallback = any(
+            typ.startswith("%") for typ, _ in indices if typ is not None
+        )
+
+        registry: dict[str, Schema] | None = None
+        # dispatched type -> compiled validator, None when the registry doesn't have it
+        dispatched: dict[str, Validator | None] = {}
+
+        def lookup(typ: str) -> Validator | None:
+            if typ in dispatched:
+                return dispatched[typ]
+
+            found_schema = registry.get(typ)
+            if found_schema is None:
+                found_schema = registry.get(typ.replace("minecraft:", ""))
+
+            validator = self.compile(found_schema) if found_schema else None
+            dispatched[typ] = validator
+            return validator
+
+        def validate(data: Json, path: list[str | int], parent: Json | None):
+            nonlocal registry
+            if (data_type := type(data)) is not dict and data_type is not list:
+                raise ValidationError(path[-1], data, "dispatcher (list|dict)")
+
+            # resolved on first use, parsing a registry is expensive
+            if registry is None:
+                registry = self.get_dispatcher_schema(registry_path)
+                if registry is None:
+                    raise ValidationError(registry_path, None, "registry not found")
+
+            if registry is DUMMY_SCHEMA:
+                return
+
+            fallback = static_fallback
+            for typ, accessor in indices:
+                if accessor is not None:
+                    typ = parent[accessor]
+
+                if (validator := lookup(typ)) is not None:
+                    if accessor is None:
+                        validator(data, path, data)
+                    else:
+                        dispatched_data = dict(data)
+                        dispatched_data.pop(accessor, None)
+                        validator(dispatched_data, path, data)
+                    return
+
+                if accessor is not None and typ.startswith("%"):
+                    fallback = True
+
+            if not fallback:
+                raise DispatcherNotFound(
+                    f"Dispatcher not found for {data}: registry {registry}", data
+                )
+
+        return validate
+
+
+def _compile_length_check(
+    length_range: ValueRange | None, expected: str
+) -> Callable[[list[Json], list[str | int]], None] | None:
+    """Builds the length check for a list-like schema, or None if it has no bounds."""
+
+    if length_range is None:
+        return None
+
+    low, high = length_range.min, length_range.max
+    if low is None and high is None:
+        return None
+
+    def check_length(data: list[Json], path: list[str | int]):
+        length = len(data)
+        if low is not None and length < low:
+            raise ValidationError(
+                path[-1],
+                data,
+                expected,
+                msg=f"List length {length} is less than minimum required {low}",
+            )
+        if high is not None and length > high:
+            raise ValidationError(
+                path[-1],
+                data,
+                expected,
+                msg=f"List length {length} is greater than maximum allowed {high}",
+            )
+
+    return check_length
+
+
+# schema kinds without child schemas, their validators only depend on their json
+_LEAF_SCHEMAS = frozenset(
+    {
+        IntArraySchema,
+        FloatArraySchema,
+        StringSchema,
+        IntSchema,
+        FloatSchema,
+        BooleanSchema,
+        ByteSchema,
+        LiteralSchema,
+        EnumSchema,
+    }
+)
+
+
+_INT_TYPES = frozenset({int, bool})
+_FLOAT_TYPES = frozenset({int, float, bool})
+
+# exact data types a schema kind can accept, used to rule out union members early
+_SHAPES: dict[type, frozenset[type]] = {
+    ListSchema: frozenset({list}),
+    IntArraySchema: frozenset({list}),
+    FloatArraySchema: frozenset({list}),
+    StringSchema: frozenset({str}),
+    IntSchema: frozenset({int}),
+    FloatSchema: _FLOAT_TYPES,
+    BooleanSchema: frozenset({bool}),
+    ByteSchema: _INT_TYPES,
+    StructSchema: frozenset({dict}),
+    DispatcherSchema: frozenset({list, dict}),
+}
+
+_JSON_TYPES = (dict, list, str, int, float, bool, type(None))
+
+
+def _shape(
+    root: Any, resolve: Callable[[Schema], Schema], seen: frozenset[int] = frozenset()
+) -> frozenset[type] | None:
+    """Returns the exact data types the schema can accept, or None if it can't tell."""
+
+    match root:
+        case LiteralSchema(value=IntLiteralValue()):
+            return _INT_TYPES
+        case LiteralSchema(value=BooleanLiteralValue()):
+            return frozenset({bool})
+        case LiteralSchema(value=StringLiteralValue()):
+            return frozenset({str})
+        case EnumSchema(enum_kind="string"):
+            return _SHAPES[StringSchema]
+        case UnionSchema(members=members) if id(root) not in seen:
+            seen |= {id(root)}
+            shapes = [_shape(resolve(member).root, resolve, seen) for member in members]
+            if None in shapes:
+                return None
+            return frozenset().union(*shapes)
+        case _:
+            # anything else (e.g. byte literals, which equal 0/1) can't be ruled out
+            return _SHAPES.get(type(root))
+
+
+def _literal_check(root: Any) -> Callable[[Json], bool] | None:
+    """Returns an equality check for literal schemas, so mismatches skip raising."""
+
+    if isinstance(root, LiteralSchema):
+        value = root.value.value
+        return lambda data: data == value
+
+    return None
+
+
+def _accept(data: Json, path: list[str | int], parent: Json | None):
+    """Validator for schemas without anything to check (e.g. pruned by version)."""
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Any, Union
 
 
@@ -8,6 +9,10 @@ class ItemError(Exception):
 class ValidationError(ItemError):
     """Validation error for components and subcomponents / fields"""
 
+    # exceptions only allocate their `__dict__` once an attribute lands outside the
+    # slots, so keeping every field in slots keeps large error trees lighter
+    __slots__ = ("name", "value", "expected", "suberrors", "msg")
+
     name: str
     value: Any
     expected: type
@@ -31,14 +36,19 @@ class ValidationError(ItemError):
 
 
 class DispatcherNotFound(ValidationError):
+    __slots__ = ()
+
     def __init__(self, name: str, value: Any):
         super().__init__(name, value, "null", [])
 
 
-class MissingValidationError(ValidationError): ...
+class MissingValidationError(ValidationError):
+    __slots__ = ()
 
 
 class UnexpectedValidationError(ValidationError):
+    __slots__ = ()
+
     def __init__(self, name: str, value: Any):
         super().__init__(name, value, "null", [])
 
@@ -46,21 +56,34 @@ class UnexpectedValidationError(ValidationError):
 class ComponentTypeError(ValidationError):
     """Error when an entire component value is the wrong type"""
 
+    __slots__ = ("actual_type",)
+
     def __init__(self, name: str, value: Any, expected_type: type, actual_type: type):
         self.actual_type = actual_type
         msg = f"Expected {expected_type.__name__} but got {actual_type.__name__}"
         super().__init__(name, value, expected_type, [], msg=msg)
 
 
+@dataclass(frozen=True, slots=True)
+class SourceInfo:
+    """Where a component was defined, for error messages"""
+
+    class_name: str
+    module: str
+    original_value: Any
+
+
 class ComponentError(ItemError):
     """A component error"""
 
+    __slots__ = ("name", "component", "suberrors", "msg", "hint", "source_info")
+
     name: str
     component: Any
     suberrors: list[ValidationError | Exception]
     msg: str
     hint: str | None
-    source_info: dict[str, Any] | None
+    source_info: SourceInfo | None
 
     def __init__(
         self,
@@ -69,7 +92,7 @@ class ComponentError(ItemError):
         suberrors: list[ValidationError] = [],
         msg: str = "",
         hint: str | None = None,
-        source_info: dict[str, Any] | None = None,
+        source_info: SourceInfo | None = None,
     ):
         self.name = name
         self.component = component
@@ -88,6 +111,8 @@ class ComponentError(ItemError):
 class NonExistentComponentError(ComponentError):
     """When an component does not exist"""
 
+    __slots__ = ("suggestions",)
+
     suggestions: list[str]
 
     def __init__(self, name: str, suggestions: list[str] | None = None):
@@ -98,6 +123,8 @@ class NonExistentComponentError(ComponentError):
 class CustomComponentError(ComponentError):
     """Errors related to custom components"""
 
+    __slots__ = ()
+
     def __init__(self, msg: str, name: str, component: Any):
         super().__init__(name, component, msg=msg)
 
@@ -105,5 +132,7 @@ class CustomComponentError(ComponentError):
 class CustomTransformerError(ComponentError):
     """Errors related to custom transformers"""
 
+    __slots__ = ()
+
     def __init__(self, msg: str, name: str, component: Any):
         super().__init__(name, component, msg=msg)
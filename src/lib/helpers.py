@@ -3,15 +3,27 @@ import copy
 from contextlib import contextmanager
 import dataclasses
 from decimal import Decimal
+import difflib
+import functools
 import json
 import re
-from typing import Any, Literal, Protocol, Union, get_args, get_origin, overload
+from types import NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Literal,
+    Protocol,
+    Union,
+    get_args,
+    get_origin,
+    overload,
+)
 import zlib
 
 from bolt_expressions.api import Objective
 import dacite
 from bolt_expressions import Source
-from typeguard import ForwardRefPolicy, TypeCheckMemo, check_type as _check_type, TypeCheckError
+from typeguard import ForwardRefPolicy, TypeCheckMemo, check_type as _typeguard_check_type, TypeCheckError
 
 from lib.types import NumberLike
 
@@ -20,51 +32,78 @@ def clamp(value: NumberLike, lower: NumberLike, upper: NumberLike):
     return max(lower, min(upper, value))
 
 
-def title_case_to_snake_case(title_case_str: str):
-    """Converts a title case string into snake case"""
-    snake_case_str = []
-    for index, char in enumerate(title_case_str):
-        # TitleCase usually starts with an uppercase so we ignore the first character
-        if char.isupper() and index != 0:
-            snake_case_str.append("_")
+# every uppercase letter but the first starts a new word
+_TITLE_TO_SNAKE_PAT = re.compile(r"(?<!^)(?=[A-Z])")
 
-        snake_case_str.append(char.lower())
 
-    return "".join(snake_case_str)
+def title_case_to_snake_case(title_case_str: str):
+    """Converts a title case string into snake case"""
+    # TitleCase usually starts with an uppercase so we ignore the first character
+    return _TITLE_TO_SNAKE_PAT.sub("_", title_case_str).lower()
 
 
 def nbt_dump(obj: dict[str, Any]):
     """Helper to dump generic dicts into serialized nbt"""
 
+    # every piece is pushed onto one list and joined once at the end
+    out: list[str] = []
+    push = out.append
+
     def serialize(obj: Any):
         match obj:
             case dict():
-                items = []
-                for key, value in obj.items():
+                push("{")
+                for i, (key, value) in enumerate(obj.items()):
+                    if i:
+                        push(", ")
                     # we need to stringify keys..
-                    serialized_key = serialize(key) if ":" in key else key
-                    serialized_value = serialize(value)
-                    items.append(f"{serialized_key}: {serialized_value}")
-                return "{" + ", ".join(items) + "}"
+                    if ":" in key:
+                        serialize(key)
+                    else:
+                        push(key)
+                    push(": ")
+                    serialize(value)
+                push("}")
             case list():
-                items = [serialize(element) for element in obj]
-                return "[" + ", ".join(items) + "]"
+                push("[")
+                for i, element in enumerate(obj):
+                    if i:
+                        push(", ")
+                    serialize(element)
+                push("]")
             case str():
                 if "'" not in obj:
-                    return f"'{obj}'"
-                return f'"{obj}"'
+                    push(f"'{obj}'")
+                else:
+                    push(f'"{obj}"')
             case bool() as b:
-                if b:
-                    return "true"
-                return "false"
+                push("true" if b else "false")
             case _:
-                return json.dumps(obj)
+                push(json.dumps(obj))
+
+    serialize(obj)
+    return "".join(out)
 
-    return serialize(obj)
+
+_IMMUTABLE_SCALARS = frozenset({str, int, float, bool, bytes, type(None)})
 
 
 def copy_with_sources(value: Any) -> Any:
     """Deep-copy plain values while preserving bolt expression sources."""
+    # scalars can't be mutated, so there's nothing to copy
+    if (value_type := type(value)) in _IMMUTABLE_SCALARS:
+        return value
+
+    # plain JSON-like trees are the common case, so dispatch on their exact type
+    # before paying for the lazy import and the isinstance chain below
+    if value_type is dict:
+        return {
+            key if type(key) is str else copy_with_sources(key): copy_with_sources(child)
+            for key, child in value.items()
+        }
+    if value_type is list:
+        return [copy_with_sources(child) for child in value]
+
     from src.item.type import ItemType
 
     if isinstance(value, (ItemType, Objective, Source)):
@@ -83,6 +122,27 @@ def copy_with_sources(value: Any) -> Any:
     return copy.deepcopy(value)
 
 
+def freeze(value: Any) -> Any:
+    """Converts plain component data into a hashable key that compares by value.
+
+    Scalars are tagged with their type so that `1`, `1.0` and `True` stay distinct.
+    Classes (e.g. items or `Remove`) compare by identity. Anything else raises a
+    `TypeError` since we can't guarantee its `__eq__` is a plain value comparison.
+    """
+    match value:
+        case dict():
+            return (dict, frozenset((key, freeze(child)) for key, child in value.items()))
+        case list() | tuple():
+            return (type(value), tuple(freeze(child) for child in value))
+        case type():
+            return value
+
+    if type(value) in _IMMUTABLE_SCALARS:
+        return (type(value), value)
+
+    raise TypeError(f"Cannot freeze value of type {type(value).__name__!r}")
+
+
 @overload
 def deep_merge_dicts(
     d1: dict[str, Any], d2: dict[str, Any], inplace: Literal[False]
@@ -107,11 +167,30 @@ def deep_merge_dicts(
     Returns:
         dict: The deeply merged dictionary.
     """
-    if inplace:
-        merged = d1
-    else:
-        merged = copy_with_sources(dict(d1))  # Make a copy of the first dictionary
+    if not inplace:
+        # copy d1 while merging instead of copying it up front, so values that d2
+        # overrides or recurses into aren't copied (and walked) twice
+        merged = {}
+        for key, value in d1.items():
+            if key not in d2:
+                merged[key] = copy_with_sources(value)
+                continue
+
+            match (value, d2[key]):
+                case (dict() as d1_value, dict() as d2_value):
+                    merged[key] = deep_merge_dicts(d1_value, d2_value)
+                case (list() as list1, list() as list2):
+                    merged[key] = copy_with_sources(list1) + list2
+                case (_, d2_value):
+                    merged[key] = d2_value
+
+        for key, value in d2.items():
+            if key not in merged:
+                merged[key] = value
 
+        return merged
+
+    merged = d1
     for key, value in d2.items():
         if key in merged:
             match (merged[key], value):
@@ -177,8 +256,31 @@ def coerce_type(value: Any, t: type) -> Any:
     return value
 
 
+_SCALAR_TYPE_CHECKS: dict[tuple[type, Any, Any], bool] = {}
+
+
 def check_type(value: Any, expected_type: type) -> bool:
-    """Wrapper around typeguard's check_type that returns a boolean instead of raising an error."""
+    """Wrapper around typeguard's check_type that returns a boolean instead of raising an error.
+
+    Results for immutable scalars are memoized, since the same literal values get checked
+    against the same field annotations for every item sharing a component.
+    """
+    if type(value) not in _IMMUTABLE_SCALARS:
+        return _check_type(value, expected_type)
+
+    # the value's type is part of the key so `1`, `1.0` and `True` stay distinct
+    key = (type(value), value, expected_type)
+    try:
+        return _SCALAR_TYPE_CHECKS[key]
+    except KeyError:
+        result = _SCALAR_TYPE_CHECKS[key] = _check_type(value, expected_type)
+        return result
+    except TypeError:
+        # unhashable annotation (e.g. `Annotated` with dict metadata)
+        return _check_type(value, expected_type)
+
+
+def _check_type(value: Any, expected_type: type) -> bool:
     def typecheck_fail_callback(error: TypeCheckError, memo: TypeCheckMemo):
         try:
             from item.type import ItemType
@@ -198,7 +300,7 @@ def check_type(value: Any, expected_type: type) -> bool:
     except dacite.DaciteError:
         return False
     try:
-        _check_type(
+        _typeguard_check_type(
             _coerceed_value,
             expected_type,
             forward_ref_policy=ForwardRefPolicy.IGNORE,
@@ -210,6 +312,78 @@ def check_type(value: Any, expected_type: type) -> bool:
     return True
 
 
+# typeguard follows the numeric tower, so ints are accepted where floats are expected
+_NUMERIC_TOWER: dict[type, tuple[type, ...]] = {
+    float: (int, float),
+    complex: (int, float, complex),
+}
+
+
+def _plain_classes(expected_type: Any) -> tuple[type, ...] | None:
+    """Flattens an annotation into the classes an `isinstance` check needs, if it can.
+
+    Returns `None` for anything `isinstance` can't express, including `Any` and other
+    special forms nested inside unions.
+    """
+    if expected_type is Any:
+        return None
+
+    if get_origin(expected_type) is Annotated:
+        return _plain_classes(get_args(expected_type)[0])
+
+    if get_origin(expected_type) in (Union, UnionType):
+        classes = []
+        for member in get_args(expected_type):
+            if (member_classes := _plain_classes(member)) is None:
+                return None
+            classes.extend(member_classes)
+        return tuple(classes)
+
+    if expected_type is None or expected_type is NoneType:
+        return (NoneType,)
+
+    # dicts get coerced into dataclasses, so those need the full `check_type`
+    if (
+        isinstance(expected_type, type)
+        and get_origin(expected_type) is None
+        and not dataclasses.is_dataclass(expected_type)
+        and not getattr(expected_type, "_is_protocol", False)
+    ):
+        return _NUMERIC_TOWER.get(expected_type, (expected_type,))
+
+    return None
+
+
+def compile_type_check(expected_type: Any) -> Callable[[Any], bool]:
+    """Builds a reusable `check_type` predicate for a single annotation.
+
+    Plain classes (optionally wrapped in `Annotated` or unions of them) reduce to one
+    `isinstance` call, and only values failing it go through `check_type` (which still
+    lets `Source` and `ItemType` values through). Anything else (generics, literals,
+    dataclasses, `Any`) always uses `check_type`.
+    """
+    if expected_type is Any:
+        return lambda value: True
+
+    if (classes := _plain_classes(expected_type)) is not None:
+        return lambda value: isinstance(value, classes) or check_type(
+            value, expected_type
+        )
+
+    return lambda value: check_type(value, expected_type)
+
+
+@functools.cache
+def close_matches(
+    word: str, possibilities: tuple[str, ...], n: int = 3, cutoff: float = 0.6
+) -> tuple[str, ...]:
+    """Fuzzy "did you mean?" lookup via difflib.
+
+    `possibilities` is a frozen corpus, so results are memoized per misspelling.
+    """
+    return tuple(difflib.get_close_matches(word, possibilities, n=n, cutoff=cutoff))
+
+
 def pretty_type(type_obj) -> str:
     if origin := get_origin(type_obj):
         if origin is Union:
@@ -230,6 +404,10 @@ _CAMEL_TO_SNAKE_PAT2 = re.compile(r"([a-z0-9])([A-Z])")
 
 def camel_case_to_snake_case(s: str) -> str:
     """Converts a camelCase or PascalCase string to snake_case."""
+    # no capitals past the first character means there are no word boundaries
+    if (tail := s[1:]) == tail.lower():
+        return s.lower()
+
     step1 = _CAMEL_TO_SNAKE_PAT1.sub(r"\1_\2", s)
     return _CAMEL_TO_SNAKE_PAT2.sub(r"\1_\2", step1).lower()
 